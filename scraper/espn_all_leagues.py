@@ -1,13 +1,16 @@
 """ESPN multi-league scraper for all men's international rugby since 2000."""
 
+import asyncio
 import csv
+import itertools
 import json
 import os
-import time
+import sys
+from operator import itemgetter
 
 from scraper.espn_api import (
-    BASE_URL, OUTPUT_DIR, fetch_json, parse_scoreboard_event,
-    get_match_roster, calculate_minutes,
+    BASE_URL, CONCURRENCY, OUTPUT_DIR, cache_max_age, fetch_json_async, parse_scoreboard_event,
+    get_match_roster_async, calculate_minutes, create_session,
 )
 
 # League configurations
@@ -51,6 +54,35 @@ LEAGUES = {
 
 PROGRESS_FILE = os.path.join(OUTPUT_DIR, "scrape_progress.json")
 
+# Max in-flight scoreboard queries for one league-year
+SCOREBOARD_CONCURRENCY = 5
+
+# Max scoreboard events waiting for a roster worker
+EVENT_QUEUE_SIZE = 100
+
+# Result posted for an event whose processing raised; its year is retried next run
+EVENT_FAILED = "failed"
+
+MATCH_FIELDS = ("season", "tournament", "date", "home_team", "away_team",
+                "home_score", "away_score", "venue", "espn_match_id")
+APPEARANCE_FIELDS = ("season", "tournament", "date", "home_team", "away_team",
+                     "team", "player_name", "shirt_number", "position", "is_starter",
+                     "sub_minute_off", "sub_minute_on", "minutes_played",
+                     "espn_match_id", "source")
+
+# Low-cardinality columns whose values repeat across thousands of rows; interned
+# on read so each distinct value is stored once while combining
+INTERNED_FIELDS = ("season", "tournament", "home_team", "away_team", "team", "position")
+
+# Combined appearances are ordered by (date, home_team, team, shirt_number)
+_APPEARANCE_SORT_KEY = itemgetter(*(APPEARANCE_FIELDS.index(k)
+                                    for k in ("date", "home_team", "team", "shirt_number")))
+
+
+def path_for(league_key, kind):
+    """Path of a per-league output CSV; kind is "matches" or "appearances"."""
+    return os.path.join(OUTPUT_DIR, f"espn_{league_key}_{kind}.csv")
+
 
 def load_progress():
     """Load scraping progress from disk."""
@@ -61,189 +93,300 @@ def load_progress():
 
 
 def save_progress(progress):
-    """Save scraping progress to disk."""
-    with open(PROGRESS_FILE, "w", encoding="utf-8") as f:
+    """Save scraping progress to disk.
+
+    Written to a temp file and renamed over the old one, so an interrupted
+    run never leaves a truncated progress.json behind.
+    """
+    tmp_path = PROGRESS_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(progress, f, indent=2)
+    os.replace(tmp_path, PROGRESS_FILE)
+
+
+async def fetch_scoreboard_events(session, urls, max_age=None):
+    """Fetch scoreboard URLs concurrently and merge their events by ID, in URL order."""
+    semaphore = asyncio.Semaphore(SCOREBOARD_CONCURRENCY)
 
+    async def bounded_fetch(url):
+        async with semaphore:
+            return await fetch_json_async(session, url, max_age=max_age)
 
-def get_events_yearly(league_id, year):
+    results = await asyncio.gather(*[bounded_fetch(url) for url in urls])
+    seen_ids = set()
+    events = []
+    for data in results:
+        if data and "events" in data:
+            for event in data["events"]:
+                eid = event["id"]
+                if eid not in seen_ids:
+                    seen_ids.add(eid)
+                    events.append(event)
+    return events
+
+
+async def get_events_yearly(session, league_id, year):
     """Single full-year scoreboard query."""
     url = f"{BASE_URL}/{league_id}/scoreboard?dates={year}0101-{year}1231"
-    data = fetch_json(url)
-    if not data or "events" not in data:
-        return []
-    return data["events"]
+    return await fetch_scoreboard_events(session, [url], cache_max_age(year))
 
 
-def get_events_monthly_rc(league_id, year):
+async def get_events_monthly_rc(session, league_id, year):
     """Monthly queries for Rugby Championship to avoid API truncation.
 
     Pre-2012 (Tri Nations, 6 matches): full-year query is fine.
     2012+ (Rugby Championship, 12 matches): API truncates, so query Jul-Dec monthly.
     """
     if year <= 2011:
-        return get_events_yearly(league_id, year)
+        return await get_events_yearly(session, league_id, year)
 
-    all_events = {}
+    urls = []
     for month in range(7, 13):  # Jul through Dec
         last_day = 31 if month in (7, 8, 10, 12) else 30
         start = f"{year}{month:02d}01"
         end = f"{year}{month:02d}{last_day}"
-        url = f"{BASE_URL}/{league_id}/scoreboard?dates={start}-{end}"
-        data = fetch_json(url)
-        time.sleep(0.5)
-        if data and "events" in data:
-            for event in data["events"]:
-                eid = event["id"]
-                if eid not in all_events:
-                    all_events[eid] = event
-    return list(all_events.values())
+        urls.append(f"{BASE_URL}/{league_id}/scoreboard?dates={start}-{end}")
+    return await fetch_scoreboard_events(session, urls, cache_max_age(year))
 
 
-def get_events_monthly_full(league_id, year):
+async def get_events_monthly_full(session, league_id, year):
     """Monthly queries for the full year to avoid API 100-event cap.
 
     Used for International Test Matches which can have 100+ events per year.
     """
-    all_events = {}
+    urls = []
     for month in range(1, 13):
         last_day = 31 if month in (1, 3, 5, 7, 8, 10, 12) else (30 if month != 2 else 28)
         start = f"{year}{month:02d}01"
         end = f"{year}{month:02d}{last_day}"
-        url = f"{BASE_URL}/{league_id}/scoreboard?dates={start}-{end}"
-        data = fetch_json(url)
-        time.sleep(0.5)
-        if data and "events" in data:
-            for event in data["events"]:
-                eid = event["id"]
-                if eid not in all_events:
-                    all_events[eid] = event
-    return list(all_events.values())
+        urls.append(f"{BASE_URL}/{league_id}/scoreboard?dates={start}-{end}")
+    return await fetch_scoreboard_events(session, urls, cache_max_age(year))
+
+
+def write_rows(f, rows, fieldnames, write_header=True):
+    """Write dict rows to an open file as CSV, in fieldnames order ("" for missing keys)."""
+    writer = csv.writer(f)
+    if write_header:
+        writer.writerow(fieldnames)
+    writer.writerows(tuple(row.get(k, "") for k in fieldnames) for row in rows)
 
 
 def save_league_matches_csv(matches, league_key):
-    """Save match data for a single league."""
+    """Append match rows for a single league, writing the header for a new file."""
     if not matches:
         return
-    filepath = os.path.join(OUTPUT_DIR, f"espn_{league_key}_matches.csv")
-    fieldnames = ["season", "tournament", "date", "home_team", "away_team",
-                  "home_score", "away_score", "venue", "espn_match_id"]
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for m in matches:
-            writer.writerow({k: m.get(k, "") for k in fieldnames})
+    filepath = path_for(league_key, "matches")
+    write_header = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+    with open(filepath, "a", newline="", encoding="utf-8") as f:
+        write_rows(f, matches, MATCH_FIELDS, write_header)
 
 
 def save_league_appearances_csv(appearances, league_key):
-    """Save player appearance data for a single league."""
+    """Append player appearance rows for a single league, writing the header for a new file."""
     if not appearances:
         return
-    filepath = os.path.join(OUTPUT_DIR, f"espn_{league_key}_appearances.csv")
-    fieldnames = ["season", "tournament", "date", "home_team", "away_team",
-                  "team", "player_name", "shirt_number", "position", "is_starter",
-                  "sub_minute_off", "sub_minute_on", "minutes_played",
-                  "espn_match_id", "source"]
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for a in appearances:
-            writer.writerow({k: a.get(k, "") for k in fieldnames})
-
-
-def scrape_league(league_key, league_config, progress):
-    """Scrape all matches for a single league."""
+    filepath = path_for(league_key, "appearances")
+    write_header = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+    with open(filepath, "a", newline="", encoding="utf-8") as f:
+        write_rows(f, appearances, APPEARANCE_FIELDS, write_header)
+
+
+async def get_league_events(session, league_config, year):
+    """Fetch a league-year's scoreboard events using the league's query strategy."""
     league_id = league_config["id"]
-    league_name = league_config["name"]
     strategy = league_config["query_strategy"]
-    season_label_fn = league_config["season_label"]
+    if strategy == "monthly_rc":
+        return await get_events_monthly_rc(session, league_id, year)
+    if strategy == "monthly_full":
+        return await get_events_monthly_full(session, league_id, year)
+    return await get_events_yearly(session, league_id, year)
 
-    all_matches = []
-    all_appearances = []
 
-    # Load any previously saved data for this league
-    matches_path = os.path.join(OUTPUT_DIR, f"espn_{league_key}_matches.csv")
-    apps_path = os.path.join(OUTPUT_DIR, f"espn_{league_key}_appearances.csv")
-    if os.path.exists(matches_path):
-        all_matches = list(read_csv(matches_path))
-    if os.path.exists(apps_path):
-        all_appearances = list(read_csv(apps_path))
+def mark_year_done(progress, league_key, year):
+    """Flag a league-year as complete and persist progress."""
+    progress.setdefault(league_key, {})[str(year)] = True
+    save_progress(progress)
 
-    league_progress = progress.get(league_key, {})
 
-    for year in league_config["years"]:
-        year_str = str(year)
-        if league_progress.get(year_str):
-            print(f"  Year {year}: already done, skipping")
-            continue
+async def produce_events(session, leagues, progress, event_queue, write_queue):
+    """Producer: walk leagues x years, queueing every scoreboard event for the roster workers.
 
-        print(f"\n  Year {year}...")
+    The writer is told how many events each year has before any of them are
+    queued, so it always knows when a year is complete.
+    """
+    for league_key, config in leagues.items():
+        print(f"\n{'='*60}")
+        print(f"Scraping: {config['name']} (league {config['id']})")
+        print(f"{'='*60}")
+        league_progress = progress.get(league_key, {})
 
-        # Get events using appropriate strategy
-        if strategy == "monthly_rc":
-            events = get_events_monthly_rc(league_id, year)
-        elif strategy == "monthly_full":
-            events = get_events_monthly_full(league_id, year)
-        else:
-            events = get_events_yearly(league_id, year)
+        for year in config["years"]:
+            if league_progress.get(str(year)):
+                print(f"  Year {year}: already done, skipping")
+                continue
 
-        if not events:
-            print(f"    No matches found")
-            league_progress[year_str] = True
-            progress[league_key] = league_progress
-            save_progress(progress)
-            continue
+            events = await get_league_events(session, config, year)
+            print(f"  {config['name']} {year}: found {len(events)} matches")
+            await write_queue.put(("year", league_key, year, len(events)))
+            for index, event in enumerate(events):
+                await event_queue.put((league_key, year, index, event))
+
+
+async def build_event_result(session, semaphore, config, year, event):
+    """Fetch one event's roster and build its (match, appearances, player count) result.
 
-        print(f"    Found {len(events)} matches")
+    Returns None for events that aren't two-team fixtures.
+    """
+    league_name = config["name"]
+    match_info = parse_scoreboard_event(event, year)
+    if match_info is None:
+        return None
+
+    rosters = await get_match_roster_async(
+        session, semaphore, event["id"], config["id"], max_age=cache_max_age(year)
+    )
+
+    # Override season label and add tournament
+    match_info["season"] = config["season_label"](year)
+    match_info["tournament"] = league_name
+
+    apps = []
+    if rosters:
+        apps = calculate_minutes(match_info, rosters)
+        # Inject extra fields into each appearance
+        for app in apps:
+            app["tournament"] = league_name
+            app["espn_match_id"] = match_info["espn_match_id"]
+    player_count = sum(len(p) for p in rosters.values()) if rosters else 0
+
+    match_clean = {k: v for k, v in match_info.items() if k != "match_events"}
+    return match_clean, apps, player_count
 
-        for i, event in enumerate(events):
-            match_info = parse_scoreboard_event(event, year)
-            # Override season label and add tournament
-            match_info["season"] = season_label_fn(year)
-            match_info["tournament"] = league_name
 
-            print(f"    [{i+1}/{len(events)}] {match_info['home_team']} "
-                  f"{match_info['home_score']}-{match_info['away_score']} "
-                  f"{match_info['away_team']}")
+async def fetch_rosters(session, semaphore, leagues, event_queue, write_queue):
+    """Consumer: fetch each queued event's roster and pass the parsed rows to the writer.
+
+    Every event posts a result (None if skipped, EVENT_FAILED if it raised),
+    so the writer can always complete its year.
+    """
+    while True:
+        item = await event_queue.get()
+        if item is None:
+            return
+        league_key, year, index, event = item
+        config = leagues[league_key]
+        try:
+            result = await build_event_result(session, semaphore, config, year, event)
+        except Exception as e:
+            print(f"  {config['name']} {year}: event {event.get('id', '?')} failed: "
+                  f"{type(e).__name__}: {e}")
+            result = EVENT_FAILED
+        await write_queue.put(("match", league_key, year, index, result))
+
+
+async def write_results(leagues, progress, write_queue):
+    """Single writer: gather each year's rows and append them once the whole year is in.
+
+    Rows are written in scoreboard order regardless of the order rosters arrive,
+    and a year is only flagged in progress.json after its rows are on disk.
+    """
+    pending = {}  # (league_key, year) -> results list indexed by event position
+    remaining = {}
+    while True:
+        item = await write_queue.get()
+        if item is None:
+            return
+
+        if item[0] == "year":
+            _, league_key, year, event_count = item
+            if event_count == 0:
+                print(f"\n  {leagues[league_key]['name']} {year}: no matches found")
+                mark_year_done(progress, league_key, year)
+            else:
+                pending[(league_key, year)] = [None] * event_count
+                remaining[(league_key, year)] = event_count
+            continue
 
-            # Fetch roster
-            time.sleep(0.5)
-            rosters = get_match_roster(event["id"], league_id)
+        _, league_key, year, index, result = item
+        key = (league_key, year)
+        pending[key][index] = result
+        remaining[key] -= 1
+        if remaining[key]:
+            continue
 
-            if rosters:
-                player_count = sum(len(p) for p in rosters.values())
+        results = pending.pop(key)
+        del remaining[key]
+        print(f"\n  {leagues[league_key]['name']} {year}:")
+        year_matches = []
+        year_appearances = []
+        failed = 0
+        for i, result in enumerate(results):
+            if result is None:
+                print(f"    [{i+1}/{len(results)}] Skipped")
+                continue
+            if result is EVENT_FAILED:
+                print(f"    [{i+1}/{len(results)}] FAILED")
+                failed += 1
+                continue
+            match, apps, player_count = result
+            print(f"    [{i+1}/{len(results)}] {match['home_team']} "
+                  f"{match['home_score']}-{match['away_score']} "
+                  f"{match['away_team']}")
+            if player_count:
                 print(f"      Roster: {player_count} players")
-                apps = calculate_minutes(match_info, rosters)
-                # Inject extra fields into each appearance
-                for app in apps:
-                    app["tournament"] = league_name
-                    app["espn_match_id"] = match_info["espn_match_id"]
-                all_appearances.extend(apps)
             else:
                 print(f"      WARNING: No roster data")
+            year_matches.append(match)
+            year_appearances.extend(apps)
 
-            match_clean = {k: v for k, v in match_info.items() if k != "match_events"}
-            all_matches.append(match_clean)
-
-        # Incremental save after each year
-        save_league_matches_csv(all_matches, league_key)
-        save_league_appearances_csv(all_appearances, league_key)
-        league_progress[year_str] = True
-        progress[league_key] = league_progress
-        save_progress(progress)
-        print(f"    Saved: {len(all_matches)} matches, {len(all_appearances)} appearances so far")
+        # A year is only written once all of its events came back; the retry
+        # on the next run fetches the whole year again.
+        if failed:
+            print(f"    {failed} events failed; nothing saved, the year will be retried on the next run")
+            continue
+        save_league_appearances_csv(year_appearances, league_key)
+        save_league_matches_csv(year_matches, league_key)
+        print(f"    Saved: {len(year_matches)} matches, {len(year_appearances)} appearances")
+        mark_year_done(progress, league_key, year)
 
-    return all_matches, all_appearances
 
+async def scrape_leagues(session, leagues, progress):
+    """Run the scoreboard producer, roster workers and CSV writer as one pipeline.
 
-def read_csv(filepath):
-    """Read a CSV file and return a list of dicts."""
-    rows = []
+    The bounded event queue lets scoreboards for upcoming years be fetched
+    while earlier rosters are still in flight, without racing too far ahead.
+    """
+    event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    write_queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    writer = asyncio.create_task(write_results(leagues, progress, write_queue))
+    workers = [
+        asyncio.create_task(fetch_rosters(session, semaphore, leagues, event_queue, write_queue))
+        for _ in range(CONCURRENCY)
+    ]
+
+    await produce_events(session, leagues, progress, event_queue, write_queue)
+    for _ in workers:
+        await event_queue.put(None)
+    await asyncio.gather(*workers)
+    await write_queue.put(None)
+    await writer
+
+
+def iter_csv(filepath, intern_fields=()):
+    """Yield each row of a CSV file as a dict, interning the values of intern_fields."""
     with open(filepath, encoding="utf-8") as f:
         reader = csv.DictReader(f)
+        if not intern_fields:
+            yield from reader
+            return
+        fields = [k for k in intern_fields if k in (reader.fieldnames or ())]
         for row in reader:
-            rows.append(dict(row))
-    return rows
+            for k in fields:
+                if row[k] is not None:  # short rows are padded with None
+                    row[k] = sys.intern(row[k])
+            yield row
 
 
 def deduplicate_matches(all_matches):
@@ -273,30 +416,26 @@ def deduplicate_matches(all_matches):
 
     # Secondary dedup by (date, sorted teams) for safety
     sig_seen = {}
-    result = []
     for match in seen_ids.values():
         date = match.get("date", "")[:10]
         teams = tuple(sorted([match.get("home_team", ""), match.get("away_team", "")]))
         sig = (date, teams)
         if sig not in sig_seen:
             sig_seen[sig] = match
-            result.append(match)
         else:
             existing_pri = priority.get(sig_seen[sig].get("tournament", ""), 99)
             new_pri = priority.get(match.get("tournament", ""), 99)
             if new_pri < existing_pri:
-                # Replace existing with higher priority
-                result = [m for m in result if m is not sig_seen[sig]]
-                result.append(match)
+                # Replace existing with higher priority (re-inserted last, as before)
+                del sig_seen[sig]
                 sig_seen[sig] = match
 
-    return result
+    return list(sig_seen.values())
 
 
 def deduplicate_appearances(all_appearances, valid_match_ids):
-    """Keep only appearances for deduplicated matches."""
+    """Yield only appearances for deduplicated matches, dropping repeats."""
     seen = set()
-    result = []
     for app in all_appearances:
         eid = app.get("espn_match_id", "")
         if eid not in valid_match_ids:
@@ -304,79 +443,76 @@ def deduplicate_appearances(all_appearances, valid_match_ids):
         key = (eid, app.get("player_name", ""), app.get("team", ""))
         if key not in seen:
             seen.add(key)
-            result.append(app)
-    return result
+            yield app
+
+
+def _iter_league_csvs(kind):
+    """Yield rows from every per-league CSV of the given kind ("matches" or "appearances")."""
+    for league_key in LEAGUES:
+        path = path_for(league_key, kind)
+        if os.path.exists(path):
+            yield from iter_csv(path, INTERNED_FIELDS)
+
+
+def _iter_six_nations_appearances(sn_match_lookup):
+    """Yield Six Nations appearances tagged with tournament and ESPN match ID."""
+    six_nations_apps_path = os.path.join(OUTPUT_DIR, "espn_appearances.csv")
+    if not os.path.exists(six_nations_apps_path):
+        return
+    for a in iter_csv(six_nations_apps_path, INTERNED_FIELDS):
+        a["tournament"] = "Six Nations"
+        key = (a.get("date", "")[:10], a.get("home_team", ""), a.get("away_team", ""))
+        a["espn_match_id"] = sn_match_lookup.get(key, "")
+        yield a
 
 
 def combine_all_leagues():
-    """Read per-league CSVs + existing Six Nations, deduplicate, write combined output."""
-    all_matches = []
-    all_appearances = []
+    """Read per-league CSVs + existing Six Nations, deduplicate, write combined output.
 
+    Matches are few and deduplicated in memory. Appearances are streamed from
+    disk through the dedup filter and kept only as tuples (in APPEARANCE_FIELDS
+    order) for the final sort and write. Returns (matches, appearance_rows).
+    """
     # Include existing Six Nations data
     six_nations_matches_path = os.path.join(OUTPUT_DIR, "espn_matches.csv")
-    six_nations_apps_path = os.path.join(OUTPUT_DIR, "espn_appearances.csv")
 
+    sn_matches = []
+    appearance_sources = [_iter_league_csvs("appearances")]
     if os.path.exists(six_nations_matches_path):
-        sn_matches = read_csv(six_nations_matches_path)
+        sn_matches = list(iter_csv(six_nations_matches_path, INTERNED_FIELDS))
         # Build lookup for injecting espn_match_id into appearances
         sn_match_lookup = {}
         for m in sn_matches:
             m["tournament"] = "Six Nations"
             key = (m.get("date", "")[:10], m.get("home_team", ""), m.get("away_team", ""))
             sn_match_lookup[key] = m.get("espn_match_id", "")
-        all_matches.extend(sn_matches)
-
-        if os.path.exists(six_nations_apps_path):
-            sn_apps = read_csv(six_nations_apps_path)
-            for a in sn_apps:
-                a["tournament"] = "Six Nations"
-                key = (a.get("date", "")[:10], a.get("home_team", ""), a.get("away_team", ""))
-                a["espn_match_id"] = sn_match_lookup.get(key, "")
-            all_appearances.extend(sn_apps)
-
-    # Read each new league's output
-    for league_key in LEAGUES:
-        m_path = os.path.join(OUTPUT_DIR, f"espn_{league_key}_matches.csv")
-        a_path = os.path.join(OUTPUT_DIR, f"espn_{league_key}_appearances.csv")
-        if os.path.exists(m_path):
-            all_matches.extend(read_csv(m_path))
-        if os.path.exists(a_path):
-            all_appearances.extend(read_csv(a_path))
+        appearance_sources.insert(0, _iter_six_nations_appearances(sn_match_lookup))
 
     # Deduplicate
-    deduped_matches = deduplicate_matches(all_matches)
+    deduped_matches = deduplicate_matches(itertools.chain(sn_matches, _iter_league_csvs("matches")))
     valid_ids = {m["espn_match_id"] for m in deduped_matches}
-    deduped_apps = deduplicate_appearances(all_appearances, valid_ids)
+    app_rows = [
+        tuple(a.get(k, "") for k in APPEARANCE_FIELDS)
+        for a in deduplicate_appearances(itertools.chain(*appearance_sources), valid_ids)
+    ]
 
     # Sort by date
     deduped_matches.sort(key=lambda m: m.get("date", ""))
-    deduped_apps.sort(key=lambda a: (a.get("date", ""), a.get("home_team", ""),
-                                      a.get("team", ""), a.get("shirt_number", "")))
+    app_rows.sort(key=_APPEARANCE_SORT_KEY)
 
     # Save combined files
     combined_matches_path = os.path.join(OUTPUT_DIR, "espn_all_international_matches.csv")
     combined_apps_path = os.path.join(OUTPUT_DIR, "espn_all_international_appearances.csv")
 
     if deduped_matches:
-        fieldnames = ["season", "tournament", "date", "home_team", "away_team",
-                      "home_score", "away_score", "venue", "espn_match_id"]
         with open(combined_matches_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for m in deduped_matches:
-                writer.writerow({k: m.get(k, "") for k in fieldnames})
-
-    if deduped_apps:
-        fieldnames = ["season", "tournament", "date", "home_team", "away_team",
-                      "team", "player_name", "shirt_number", "position", "is_starter",
-                      "sub_minute_off", "sub_minute_on", "minutes_played",
-                      "espn_match_id", "source"]
+            write_rows(f, deduped_matches, MATCH_FIELDS)
+
+    if app_rows:
         with open(combined_apps_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for a in deduped_apps:
-                writer.writerow({k: a.get(k, "") for k in fieldnames})
+            writer = csv.writer(f)
+            writer.writerow(APPEARANCE_FIELDS)
+            writer.writerows(app_rows)
 
     # Print summary
     tournaments = {}
@@ -385,16 +521,20 @@ def combine_all_leagues():
         tournaments[t] = tournaments.get(t, 0) + 1
 
     print(f"\n{'='*60}")
-    print(f"COMBINED OUTPUT: {len(deduped_matches)} matches, {len(deduped_apps)} appearances")
+    print(f"COMBINED OUTPUT: {len(deduped_matches)} matches, {len(app_rows)} appearances")
     print(f"{'='*60}")
     for t, count in sorted(tournaments.items()):
         print(f"  {t}: {count} matches")
 
-    return deduped_matches, deduped_apps
+    return deduped_matches, app_rows
 
 
 def scrape_all_leagues(league_filter=None):
     """Scrape all configured leagues (or a single one if filtered)."""
+    asyncio.run(_scrape_all_leagues_async(league_filter))
+
+
+async def _scrape_all_leagues_async(league_filter=None):
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     progress = load_progress()
 
@@ -409,11 +549,8 @@ def scrape_all_leagues(league_filter=None):
     else:
         leagues_to_scrape = LEAGUES
 
-    for league_key, config in leagues_to_scrape.items():
-        print(f"\n{'='*60}")
-        print(f"Scraping: {config['name']} (league {config['id']})")
-        print(f"{'='*60}")
-        scrape_league(league_key, config, progress)
+    async with create_session() as session:
+        await scrape_leagues(session, leagues_to_scrape, progress)
 
     # Combine all leagues after scraping
     print(f"\n{'='*60}")
@@ -1,16 +1,34 @@
 """ESPN Hidden API client for Six Nations rugby data extraction."""
 
+import asyncio
 import csv
 import json
 import os
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+from functools import lru_cache
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from scraper.http_cache import ResponseCache
+
+try:
+    from orjson import loads as _loads  # optional: 2-4x faster, parses bytes directly
+except ImportError:
+    _loads = json.loads
 
 BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/rugby"
 LEAGUE_ID = "180659"
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Max in-flight summary requests, and max open connections to the ESPN host
+CONCURRENCY = 15
+CONNECTIONS_PER_HOST = 10
 
 # Six Nations seasons: the "2000-01" season has matches in calendar year 2001, etc.
 # Exception: "2000" season = matches in Feb-Apr 2000 (the first Six Nations)
@@ -19,17 +37,89 @@ for year in range(2000, 2026):
     SEASONS.append(year)
 
 
-def fetch_json(url, retries=3):
-    """Fetch JSON from a URL with retries."""
+def _create_requests_session():
+    """Create a pooled keep-alive session; the adapter handles retries with back-off."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_requests_session()
+
+# Finished matches never change, so responses fetched after their year was over
+# are cached indefinitely. Anything fetched earlier may predate new fixtures or
+# final scores, and is refetched once older than CURRENT_SEASON_MAX_AGE.
+CURRENT_SEASON_MAX_AGE = 3600
+SEASON_SETTLE_DAYS = 7  # grace after New Year for late results to be published
+_CACHE = ResponseCache(os.path.join(OUTPUT_DIR, "espn_cache.sqlite"))
+
+# Parsed rosters by event ID. ESPN event IDs are global, so a match listed under
+# several leagues (e.g. a Rugby Championship test that is also a test match) is
+# only fetched and parsed once per run.
+ROSTER_MEMO_SIZE = 4096
+_ROSTER_MEMO = OrderedDict()
+_ROSTER_IN_FLIGHT = {}
+
+
+def cache_max_age(year):
+    """Max age in seconds of a usable cached response about a calendar year's matches.
+
+    Once the year has settled, the limit is the time since it settled: only
+    responses fetched after that are final, and earlier ones get refetched once.
+    """
+    settled = datetime(year + 1, 1, 1) + timedelta(days=SEASON_SETTLE_DAYS)
+    return max(time.time() - settled.timestamp(), CURRENT_SEASON_MAX_AGE)
+
+
+def fetch_json(url, max_age=None):
+    """Fetch JSON from a URL over the shared keep-alive session, via the disk cache.
+
+    Cached bodies older than max_age seconds are refetched; None keeps them forever.
+    """
+    body = _CACHE.get(url, max_age)
+    if body is not None:
+        return _loads(body)
+    try:
+        resp = _SESSION.get(url, timeout=30)
+        resp.raise_for_status()
+        data = _loads(resp.content)
+    except Exception as e:
+        print(f"  Request failed for {url}: {type(e).__name__}: {e}")
+        return None
+    _CACHE.set(url, resp.content)
+    return data
+
+
+def create_session():
+    """Create the shared aiohttp session used for concurrent ESPN requests."""
+    connector = aiohttp.TCPConnector(limit_per_host=CONNECTIONS_PER_HOST)
+    return aiohttp.ClientSession(connector=connector, headers=HEADERS)
+
+
+async def fetch_json_async(session, url, retries=3, max_age=None):
+    """Fetch JSON from a URL with retries, using a shared aiohttp session and the disk cache.
+
+    The blocking SQLite cache calls run in a worker thread, off the event loop.
+    """
+    body = await asyncio.to_thread(_CACHE.get, url, max_age)
+    if body is not None:
+        return _loads(body)
     for attempt in range(retries):
         try:
-            req = Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            with urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode())
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                resp.raise_for_status()
+                body = await resp.read()
+            data = _loads(body)
+            await asyncio.to_thread(_CACHE.set, url, body)
+            return data
         except Exception as e:
             print(f"  Attempt {attempt+1}/{retries} failed for {url}: {type(e).__name__}: {e}")
             if attempt < retries - 1:
-                time.sleep(2 ** (attempt + 1))
+                await asyncio.sleep(2 ** (attempt + 1))
     return None
 
 
@@ -43,31 +133,41 @@ def get_season_matches(year, league_id=None):
     """
     lid = league_id or LEAGUE_ID
     url = f"{BASE_URL}/{lid}/scoreboard?dates={year}0101-{year}1231"
-    data = fetch_json(url)
+    data = fetch_json(url, max_age=cache_max_age(year))
     if not data or "events" not in data:
         return []
 
     return data["events"]
 
 
+@lru_cache(maxsize=None)
+def season_label(year):
+    """Six Nations season label for a calendar year.
+
+    Matches in 2001 = "2000-01" season, etc. The first Six Nations in 2000 = "1999-00".
+    """
+    return f"{year-1}-{str(year)[-2:]}" if year > 2000 else "1999-00"
+
+
 def parse_scoreboard_event(event, year):
-    """Extract match info and events from a scoreboard event."""
+    """Extract match info and events from a scoreboard event.
+
+    Returns None for events without exactly two competitors (e.g. TBD fixtures).
+    """
     comp = event["competitions"][0]
 
     # Determine home/away teams
-    home_team = away_team = None
-    home_score = away_score = None
-    for competitor in comp["competitors"]:
-        team_name = competitor["team"]["displayName"]
-        score = competitor.get("score", "0")
-        if competitor["homeAway"] == "home":
-            home_team = team_name
-            home_score = int(score) if score else 0
-        else:
-            away_team = team_name
-            away_score = int(score) if score else 0
-
-    venue = comp.get("venue", {}).get("fullName", "")
+    competitors = comp.get("competitors", [])
+    if len(competitors) != 2:
+        return None
+    first, second = competitors
+    home, away = (first, second) if first["homeAway"] == "home" else (second, first)
+    home_team = home["team"]["displayName"]
+    away_team = away["team"]["displayName"]
+    home_score = int(home.get("score") or 0)
+    away_score = int(away.get("score") or 0)
+
+    venue = (comp.get("venue") or {}).get("fullName", "")
     date_str = event.get("date", "")
 
     # Parse match events (subs, tries, etc.)
@@ -96,14 +196,9 @@ def parse_scoreboard_event(event, year):
             "athletes": athletes,
         })
 
-    # Determine season label
-    # Six Nations "season" naming: matches in 2001 = "2000-01" season, etc.
-    # But the first Six Nations in 2000 = "2000" or "1999-00" season
-    season_label = f"{year-1}-{str(year)[-2:]}" if year > 2000 else "1999-00"
-
     return {
         "espn_match_id": event["id"],
-        "season": season_label,
+        "season": season_label(year),
         "date": date_str[:10] if date_str else "",
         "home_team": home_team,
         "away_team": away_team,
@@ -114,18 +209,87 @@ def parse_scoreboard_event(event, year):
     }
 
 
-def get_match_roster(event_id, league_id=None):
+def _freeze_rosters(rosters):
+    """Snapshot parsed rosters as nested tuples so the memo can't be mutated by callers."""
+    return tuple(
+        (team_name, tuple(tuple(player.items()) for player in players))
+        for team_name, players in rosters.items()
+    )
+
+
+def _thaw_rosters(frozen):
+    """Rebuild fresh roster dicts from a memo snapshot."""
+    return {team_name: [dict(player) for player in players] for team_name, players in frozen}
+
+
+def _remember_rosters(event_id, rosters):
+    if rosters is None:
+        return
+    _ROSTER_MEMO[event_id] = _freeze_rosters(rosters)
+    if len(_ROSTER_MEMO) > ROSTER_MEMO_SIZE:
+        _ROSTER_MEMO.popitem(last=False)
+
+
+def _recall_rosters(event_id):
+    frozen = _ROSTER_MEMO.get(event_id)
+    if frozen is None:
+        return None
+    _ROSTER_MEMO.move_to_end(event_id)
+    return _thaw_rosters(frozen)
+
+
+def get_match_roster(event_id, league_id=None, max_age=None):
     """Get the full roster for a match from the summary endpoint.
 
-    Uses the 'rosters' section which has data for all seasons (2000-2025),
-    unlike 'boxscore.players' which is empty for older matches.
+    max_age is passed on to fetch_json; see cache_max_age.
     """
+    rosters = _recall_rosters(event_id)
+    if rosters is not None:
+        return rosters
     lid = league_id or LEAGUE_ID
     url = f"{BASE_URL}/{lid}/summary?event={event_id}"
-    data = fetch_json(url)
+    data = fetch_json(url, max_age)
     if not data:
         return None
+    rosters = parse_match_roster(data)
+    _remember_rosters(event_id, rosters)
+    return rosters
+
 
+async def get_match_roster_async(session, semaphore, event_id, league_id=None, max_age=None):
+    """Async variant of get_match_roster; the semaphore bounds in-flight requests.
+
+    Concurrent requests for the same event share a single fetch.
+    """
+    rosters = _recall_rosters(event_id)
+    if rosters is not None:
+        return rosters
+    task = _ROSTER_IN_FLIGHT.get(event_id)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_match_roster(session, semaphore, event_id, league_id, max_age)
+        )
+        _ROSTER_IN_FLIGHT[event_id] = task
+        task.add_done_callback(lambda _: _ROSTER_IN_FLIGHT.pop(event_id, None))
+    await asyncio.shield(task)
+    return _recall_rosters(event_id)
+
+
+async def _fetch_match_roster(session, semaphore, event_id, league_id, max_age):
+    lid = league_id or LEAGUE_ID
+    url = f"{BASE_URL}/{lid}/summary?event={event_id}"
+    async with semaphore:
+        data = await fetch_json_async(session, url, max_age=max_age)
+    if data:
+        _remember_rosters(event_id, parse_match_roster(data))
+
+
+def parse_match_roster(data):
+    """Extract team rosters from a summary endpoint response.
+
+    Uses the 'rosters' section which has data for all seasons (2000-2025),
+    unlike 'boxscore.players' which is empty for older matches.
+    """
     rosters = {}  # team_name -> list of players
 
     # Primary source: "rosters" section (works for all seasons)
@@ -159,6 +323,7 @@ def get_match_roster(event_id, league_id=None):
             team_name = team_info.get("displayName", team_info.get("name", "Unknown"))
 
             players = []
+            seen_ids = set()
             for stat_group in section.get("statistics", []):
                 for athlete_entry in stat_group.get("athletes", []):
                     athlete = athlete_entry.get("athlete", {})
@@ -169,7 +334,8 @@ def get_match_roster(event_id, league_id=None):
                         "position": athlete.get("position", {}).get("abbreviation", "") if isinstance(athlete.get("position"), dict) else str(athlete.get("position", "")),
                         "home_away": "",
                     }
-                    if not any(p["id"] == player["id"] for p in players):
+                    if player["id"] not in seen_ids:
+                        seen_ids.add(player["id"])
                         players.append(player)
 
             if players:
@@ -178,6 +344,20 @@ def get_match_roster(event_id, league_id=None):
     return rosters
 
 
+@lru_cache(maxsize=None)
+def _substitution_kind(event_type):
+    """Classify a match event type as "on", "off" or None (not a substitution).
+
+    ESPN uses a small vocabulary of type strings, so each is classified once.
+    """
+    etype = event_type.lower()
+    if "substitute on" in etype or "sub on" in etype:
+        return "on"
+    if "substitute off" in etype or "sub off" in etype:
+        return "off"
+    return None
+
+
 def calculate_minutes(match_info, rosters):
     """Calculate minutes played for each player based on match events."""
     appearances = []
@@ -188,19 +368,18 @@ def calculate_minutes(match_info, rosters):
     sub_off_events = {}  # player_id -> minute
 
     for event in match_events:
-        etype = event["type"].lower()
+        kind = _substitution_kind(event["type"])
+        if kind is None:
+            continue
         minute = event["minute"]
         try:
             minute_int = int(minute)
         except (ValueError, TypeError):
             continue
 
+        target = sub_on_events if kind == "on" else sub_off_events
         for athlete in event["athletes"]:
-            pid = athlete["id"]
-            if "substitute on" in etype or "sub on" in etype:
-                sub_on_events[pid] = minute_int
-            elif "substitute off" in etype or "sub off" in etype:
-                sub_off_events[pid] = minute_int
+            target[athlete["id"]] = minute_int
 
     for team_name, players in rosters.items():
         for player in players:
@@ -282,48 +461,60 @@ def save_appearances_csv(appearances, filepath):
 
 def scrape_all():
     """Scrape all Six Nations data from ESPN API."""
+    return asyncio.run(_scrape_all_async())
+
+
+async def _scrape_all_async():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     all_matches = []
     all_appearances = []
 
-    for year in SEASONS:
-        season_label = f"{year-1}-{str(year)[-2:]}" if year > 2000 else "1999-00"
-        print(f"\n{'='*60}")
-        print(f"ESPN: Scraping season {season_label} (calendar year {year})")
-        print(f"{'='*60}")
-
-        events = get_season_matches(year)
-        if not events:
-            print(f"  No matches found for {year}")
-            continue
-
-        print(f"  Found {len(events)} matches")
-
-        for i, event in enumerate(events):
-            match_info = parse_scoreboard_event(event, year)
-            print(f"  [{i+1}/{len(events)}] {match_info['home_team']} {match_info['home_score']}-{match_info['away_score']} {match_info['away_team']}")
-
-            # Get full roster from summary
-            time.sleep(0.5)
-            rosters = get_match_roster(event["id"])
-
-            if rosters:
-                player_count = sum(len(p) for p in rosters.values())
-                print(f"    Roster: {player_count} players")
-                appearances = calculate_minutes(match_info, rosters)
-                all_appearances.extend(appearances)
-            else:
-                print(f"    WARNING: No roster data available")
+    async with create_session() as session:
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        for year in SEASONS:
+            print(f"\n{'='*60}")
+            print(f"ESPN: Scraping season {season_label(year)} (calendar year {year})")
+            print(f"{'='*60}")
+
+            events = get_season_matches(year)
+            max_age = cache_max_age(year)
+            if not events:
+                print(f"  No matches found for {year}")
+                continue
+
+            print(f"  Found {len(events)} matches")
+
+            # Fetch every roster for the season concurrently
+            roster_results = await asyncio.gather(
+                *[get_match_roster_async(session, semaphore, event["id"], max_age=max_age)
+                  for event in events]
+            )
+
+            for i, (event, rosters) in enumerate(zip(events, roster_results)):
+                match_info = parse_scoreboard_event(event, year)
+                if match_info is None:
+                    print(f"  [{i+1}/{len(events)}] Skipping event {event['id']}: not a two-team fixture")
+                    continue
+                print(f"  [{i+1}/{len(events)}] {match_info['home_team']} {match_info['home_score']}-{match_info['away_score']} {match_info['away_team']}")
+
+                if rosters:
+                    player_count = sum(len(p) for p in rosters.values())
+                    print(f"    Roster: {player_count} players")
+                    appearances = calculate_minutes(match_info, rosters)
+                    all_appearances.extend(appearances)
+                else:
+                    print(f"    WARNING: No roster data available")
 
-            # Remove match_events before saving (not needed in CSV)
-            match_info_clean = {k: v for k, v in match_info.items() if k != "match_events"}
-            all_matches.append(match_info_clean)
+                # Remove match_events before saving (not needed in CSV)
+                match_info_clean = {k: v for k, v in match_info.items() if k != "match_events"}
+                all_matches.append(match_info_clean)
 
-        # Incremental save after each season
-        save_matches_csv(all_matches, os.path.join(OUTPUT_DIR, "espn_matches.csv"))
-        save_appearances_csv(all_appearances, os.path.join(OUTPUT_DIR, "espn_appearances.csv"))
-        print(f"  Saved: {len(all_matches)} matches, {len(all_appearances)} appearances so far")
+            # Incremental save after each season
+            save_matches_csv(all_matches, os.path.join(OUTPUT_DIR, "espn_matches.csv"))
+            save_appearances_csv(all_appearances, os.path.join(OUTPUT_DIR, "espn_appearances.csv"))
+            print(f"  Saved: {len(all_matches)} matches, {len(all_appearances)} appearances so far")
 
     print(f"\n{'='*60}")
     print(f"ESPN COMPLETE: {len(all_matches)} matches, {len(all_appearances)} appearances")
@@ -0,0 +1,55 @@
+"""SQLite-backed on-disk cache of HTTP response bodies, keyed by URL."""
+
+import os
+import sqlite3
+import threading
+import time
+
+
+class ResponseCache:
+    """Store raw response bodies so reruns read from local disk instead of the network.
+
+    The connection is opened lazily on first use and shared between threads
+    behind a lock, so one cache instance can serve a thread pool.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, url, max_age=None):
+        """Return the cached body for a URL, or None if missing or older than max_age seconds."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, fetched_at = row
+        if max_age is not None and time.time() - fetched_at > max_age:
+            return None
+        return body
+
+    def set(self, url, body):
+        """Store (or replace) the body for a URL."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, fetched_at) VALUES (?, ?, ?)",
+                (url, body, time.time()),
+            )
+            conn.commit()
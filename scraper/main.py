@@ -3,6 +3,10 @@
 import csv
 import os
 import sys
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -13,6 +17,14 @@ from scraper.espn_all_leagues import scrape_all_leagues, combine_all_leagues
 
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
 
+APPEARANCE_FIELDS = ["season", "date", "home_team", "away_team", "team", "player_name",
+                     "shirt_number", "position", "is_starter", "sub_minute_off",
+                     "sub_minute_on", "minutes_played", "source"]
+
+# Positions of the merge key fields in an appearance tuple
+_SEASON, _HOME, _AWAY, _PLAYER, _SOURCE = (
+    APPEARANCE_FIELDS.index(k) for k in ("season", "home_team", "away_team", "player_name", "source"))
+
 
 def merge_data():
     """Merge ESPN and Sky Sports data into final CSVs."""
@@ -20,45 +32,39 @@ def merge_data():
 
     # Read ESPN data
     espn_matches = read_csv(os.path.join(OUTPUT_DIR, "espn_matches.csv"))
-    espn_appearances = read_csv(os.path.join(OUTPUT_DIR, "espn_appearances.csv"))
+    espn_appearances = read_csv_rows(os.path.join(OUTPUT_DIR, "espn_appearances.csv"), APPEARANCE_FIELDS)
 
     # Read Sky Sports data
     sky_matches = read_csv(os.path.join(OUTPUT_DIR, "sky_matches.csv"))
-    sky_appearances = read_csv(os.path.join(OUTPUT_DIR, "sky_appearances.csv"))
+    sky_appearances = read_csv_rows(os.path.join(OUTPUT_DIR, "sky_appearances.csv"), APPEARANCE_FIELDS)
 
     print(f"\nMerging data:")
     print(f"  ESPN: {len(espn_matches)} matches, {len(espn_appearances)} appearances")
     print(f"  Sky:  {len(sky_matches)} matches, {len(sky_appearances)} appearances")
 
-    # Build final matches CSV (combine both sources)
-    final_matches = []
-    for m in espn_matches:
-        final_matches.append({
-            "season": m.get("season", ""),
-            "date": m.get("date", ""),
-            "home_team": m.get("home_team", ""),
-            "away_team": m.get("away_team", ""),
-            "home_score": m.get("home_score", ""),
-            "away_score": m.get("away_score", ""),
-            "venue": m.get("venue", ""),
-            "espn_match_id": m.get("espn_match_id", ""),
-            "sky_match_id": "",
-        })
+    # Build final matches CSV (combine both sources). ESPN rows are annotated in
+    # place rather than copied; write_csv only emits the final match fields.
+    final_matches = espn_matches
+    for m in final_matches:
+        m["sky_match_id"] = ""
+
+    # Index matches by normalized fixture so each Sky match is a single lookup.
+    # setdefault keeps the first match per key, as the original linear scan did.
+    match_index = {}
+    for fm in final_matches:
+        match_index.setdefault(
+            (normalize_team(fm["home_team"]), normalize_team(fm["away_team"]), fm["season"]), fm)
 
     # Add Sky Sports match IDs to matching ESPN matches
     for sm in sky_matches:
-        matched = False
-        for fm in final_matches:
-            if (normalize_team(fm["home_team"]) == normalize_team(sm.get("home_team", "")) and
-                normalize_team(fm["away_team"]) == normalize_team(sm.get("away_team", "")) and
-                fm["season"] == sm.get("season", "")):
-                fm["sky_match_id"] = sm.get("sky_match_id", "")
-                matched = True
-                break
-
-        if not matched:
+        key = (normalize_team(sm.get("home_team", "")), normalize_team(sm.get("away_team", "")),
+               sm.get("season", ""))
+        fm = match_index.get(key)
+        if fm is not None:
+            fm["sky_match_id"] = sm.get("sky_match_id", "")
+        else:
             # Sky Sports match not in ESPN data - add it
-            final_matches.append({
+            fm = {
                 "season": sm.get("season", ""),
                 "date": sm.get("date", ""),
                 "home_team": sm.get("home_team", ""),
@@ -68,84 +74,126 @@ def merge_data():
                 "venue": "",
                 "espn_match_id": "",
                 "sky_match_id": sm.get("sky_match_id", ""),
-            })
+            }
+            final_matches.append(fm)
+            match_index[key] = fm
 
     # Sort by season then date
     final_matches.sort(key=lambda m: (m["season"], m["date"]))
 
-    # Build final appearances: prefer ESPN data (has positions), supplement with Sky Sports
-    final_appearances = []
-
-    # Add all ESPN appearances
-    for a in espn_appearances:
-        final_appearances.append(a)
-
-    # Add Sky Sports appearances that don't have ESPN equivalents
-    for sa in sky_appearances:
-        has_espn = any(
-            a["source"] == "espn" and
-            normalize_team(a["home_team"]) == normalize_team(sa.get("home_team", "")) and
-            normalize_team(a["away_team"]) == normalize_team(sa.get("away_team", "")) and
-            a["season"] == sa.get("season", "") and
-            normalize_name(a["player_name"]) == normalize_name(sa.get("player_name", ""))
-            for a in espn_appearances
-        )
-        if not has_espn:
-            final_appearances.append(sa)
+    # Build final appearances: prefer ESPN data (has positions), supplement with Sky Sports.
+    # Appearances are plain tuples in APPEARANCE_FIELDS order throughout, and the
+    # combined table is never built: ESPN rows then Sky-only rows are chained on write.
+    espn_keys = {
+        (a[_SEASON], normalize_team(a[_HOME]), normalize_team(a[_AWAY]), normalize_name(a[_PLAYER]))
+        for a in espn_appearances if a[_SOURCE] == "espn"
+    }
+
+    # Sky Sports appearances that don't have ESPN equivalents
+    sky_only_appearances = [
+        sa for sa in sky_appearances
+        if (sa[_SEASON], normalize_team(sa[_HOME]), normalize_team(sa[_AWAY]),
+            normalize_name(sa[_PLAYER])) not in espn_keys
+    ]
+    del sky_appearances, espn_keys
 
     # Save final CSVs
     match_fields = ["season", "date", "home_team", "away_team", "home_score", "away_score",
                     "venue", "espn_match_id", "sky_match_id"]
     write_csv(final_matches, match_fields, os.path.join(OUTPUT_DIR, "matches.csv"))
 
-    appearance_fields = ["season", "date", "home_team", "away_team", "team", "player_name",
-                         "shirt_number", "position", "is_starter", "sub_minute_off",
-                         "sub_minute_on", "minutes_played", "source"]
-    write_csv(final_appearances, appearance_fields, os.path.join(OUTPUT_DIR, "appearances.csv"))
+    write_csv_rows(chain(espn_appearances, sky_only_appearances), APPEARANCE_FIELDS,
+                   os.path.join(OUTPUT_DIR, "appearances.csv"))
 
     # Print summary
-    seasons = set(m["season"] for m in final_matches)
+    match_counts = Counter(m["season"] for m in final_matches)
+    app_counts = Counter(a[_SEASON] for a in chain(espn_appearances, sky_only_appearances))
     print(f"\n{'='*60}")
     print(f"FINAL OUTPUT:")
-    print(f"  Seasons: {len(seasons)}")
+    print(f"  Seasons: {len(match_counts)}")
     print(f"  Matches: {len(final_matches)}")
-    print(f"  Appearances: {len(final_appearances)}")
+    print(f"  Appearances: {len(espn_appearances) + len(sky_only_appearances)}")
     print(f"  Files: output/matches.csv, output/appearances.csv")
     print(f"{'='*60}")
 
     # Per-season summary
     print(f"\nPer-season breakdown:")
-    for s in sorted(seasons):
-        s_matches = [m for m in final_matches if m["season"] == s]
-        s_apps = [a for a in final_appearances if a["season"] == s]
-        print(f"  {s}: {len(s_matches)} matches, {len(s_apps)} appearances")
+    for s in sorted(match_counts):
+        print(f"  {s}: {match_counts[s]} matches, {app_counts[s]} appearances")
 
 
+@lru_cache(maxsize=None)
 def normalize_team(name):
-    """Normalize team name for comparison."""
+    """Normalize team name for comparison.
+
+    Cached: the merge normalizes the same few team and player names many times.
+    """
     return name.strip().lower()
 
 
+@lru_cache(maxsize=None)
 def normalize_name(name):
     """Normalize player name for comparison."""
-    return name.strip().lower().replace("'", "'")
+    return name.strip().lower().replace("\u2019", "'")
 
 
 def read_csv(filepath):
     """Read a CSV file into a list of dicts."""
     if not os.path.exists(filepath):
         return []
-    with open(filepath, "r", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+    with open(filepath, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        # Same rows as csv.DictReader (blank lines skipped), minus its per-row overhead
+        return [dict(zip(header, row)) for row in reader if row]
+
+
+def read_csv_rows(filepath, fieldnames):
+    """Read a CSV file into a list of tuples holding `fieldnames` in order.
+
+    Columns missing from the file read as "". Cheaper than read_csv for large
+    tables that are only passed through.
+    """
+    if not os.path.exists(filepath):
+        return []
+    with open(filepath, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        # Missing columns point one past the header. Every row is cut to the
+        # header width and padded with "" through that cell, so short rows read
+        # "" for their absent trailing fields and surplus cells are ignored.
+        width = len(header)
+        getter = itemgetter(*(header.index(k) if k in header else width for k in fieldnames))
+        rows = []
+        for row in reader:
+            if row:
+                del row[width:]
+                row += [""] * (width + 1 - len(row))
+                rows.append(getter(row))
+        return rows
 
 
 def write_csv(rows, fieldnames, filepath):
     """Write a list of dicts to CSV."""
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+    # 1 MiB buffer: far fewer write syscalls on the large appearances file
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        # Plain tuples in field order: same output as DictWriter(extrasaction="ignore")
+        # without its per-row dict checks
+        writer.writerows(tuple(row.get(k, "") for k in fieldnames) for row in rows)
+
+
+def write_csv_rows(rows, fieldnames, filepath):
+    """Write an iterable of tuples (already in fieldnames order) to CSV."""
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
 
 def main():
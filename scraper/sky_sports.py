@@ -3,10 +3,16 @@
 import csv
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from scraper.http_cache import ResponseCache
 
 BASE_URL = "https://www.skysports.com"
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
@@ -18,22 +24,101 @@ AVAILABLE_SEASONS = [
     "2019-20", "2020-21", "2023-24", "2024-25",
 ]
 
+MATCH_FIELDS = ["season", "date", "home_team", "away_team", "home_score", "away_score",
+                "sky_match_id", "slug"]
+APPEARANCE_FIELDS = ["season", "date", "home_team", "away_team", "team", "player_name",
+                     "shirt_number", "position", "is_starter", "sub_minute_off",
+                     "sub_minute_on", "minutes_played", "source"]
+
+# Teams pages are fetched by a small thread pool; the rate limiter keeps the
+# overall request rate polite no matter how many workers are running
+MAX_WORKERS = 4
+REQUEST_INTERVAL = 0.5  # seconds between requests to Sky Sports
+
+
+class RateLimiter:
+    """Space calls at least `interval` seconds apart across all threads."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
-def fetch_html(url, retries=3):
-    """Fetch HTML from a URL with retries."""
-    for attempt in range(retries):
-        try:
-            req = Request(url, headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml",
-            })
-            with urlopen(req, timeout=30) as resp:
-                return resp.read().decode("utf-8", errors="replace")
-        except (HTTPError, URLError) as e:
-            print(f"  Attempt {attempt+1}/{retries} failed for {url}: {e}")
-            if attempt < retries - 1:
-                time.sleep(2 ** attempt)
-    return None
+
+_RATE_LIMITER = RateLimiter(REQUEST_INTERVAL)
+
+
+def _create_session():
+    """Create a keep-alive session shared by the fetch threads.
+
+    The adapter retries throttling and server errors with back-off (honouring
+    Retry-After); other errors such as 404s fail straight away.
+    """
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "gzip, deflate",
+    })
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504),
+                  respect_retry_after_header=True)
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+# Archived seasons don't change, so pages are reused for a month; the current
+# season's results page is refreshed hourly so new results show up
+CACHE_MAX_AGE = 30 * 24 * 3600
+CURRENT_SEASON_MAX_AGE = 3600
+_CACHE = ResponseCache(os.path.join(OUTPUT_DIR, "sky_cache.sqlite"))
+
+# Results page: one match block per fixres__item, plus its team names and scores
+_BLOCK_RE = re.compile(
+    r'<div\s+class="fixres__item">\s*'
+    r'<a\s+href="(?:https://www\.skysports\.com)?(/rugby-union/([a-z-]+-vs-[a-z-]+)/(\d+))"'
+    r'[^>]*>(.+?)</a>',
+    re.DOTALL | re.IGNORECASE
+)
+_TEAM_NAMES_RE = re.compile(r'<span\s+class="swap-text__target">([^<]+)</span>')
+_SCORES_RE = re.compile(r'<span\s+class="matches__teamscores-side">\s*(\d+)\s*</span>')
+
+# Teams page: team section openers, player entries and their fields
+_TEAM_SECTION_RE = re.compile(r'<div\s+class="team-lineups__list-team">')
+_TEAM_NAME_RE = re.compile(r'<h3\s+class="block-header__title">([^<]+)</h3>')
+_PLAYER_LI_RE = re.compile(r'<li\s+class="team-lineups__list-player"[^>]*>.*?</li>', re.DOTALL)
+_NUMBER_RE = re.compile(r'team-lineups__list-player-number[^>]*>\s*(\d{1,2})\s*<')
+_PNAME_RE = re.compile(r'team-lineups__list-player-name[^>]*>\s*(.+?)\s*<')
+_SUB_OFF_RE = re.compile(r'substitution_off\.svg[^>]*>\s*(\d+)')
+_SUB_ON_RE = re.compile(r'substitution_on\.svg[^>]*>\s*(\d+)')
+
+
+def fetch_html(url, max_age=CACHE_MAX_AGE):
+    """Fetch HTML from a URL, serving it from the on-disk cache when fresh."""
+    body = _CACHE.get(url, max_age)
+    if body is not None:
+        return body.decode("utf-8", errors="replace")
+    _RATE_LIMITER.wait()
+    try:
+        resp = _SESSION.get(url, timeout=30)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        print(f"  Request failed for {url}: {e}")
+        return None
+    _CACHE.set(url, resp.content)
+    return resp.content.decode("utf-8", errors="replace")
 
 
 def parse_results_page(html):
@@ -48,33 +133,17 @@ def parse_results_page(html):
     """
     matches = []
 
-    # Extract each match block: from <div class="fixres__item"> to closing </div> + </a>
-    # The match link contains the slug and ID in the href
-    # Use the full match block pattern
-    block_pattern = re.compile(
-        r'<div\s+class="fixres__item">\s*'
-        r'<a\s+href="(?:https://www\.skysports\.com)?(/rugby-union/([a-z-]+-vs-[a-z-]+)/(\d+))"'
-        r'[^>]*>(.+?)</a>',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for block_match in block_pattern.finditer(html):
+    for block_match in _BLOCK_RE.finditer(html):
         href = block_match.group(1)
         slug = block_match.group(2)
         match_id = block_match.group(3)
         block_html = block_match.group(4)
 
         # Extract team names from swap-text__target spans
-        team_names = re.findall(
-            r'<span\s+class="swap-text__target">([^<]+)</span>',
-            block_html
-        )
+        team_names = _TEAM_NAMES_RE.findall(block_html)
 
         # Extract scores from matches__teamscores-side spans
-        scores = re.findall(
-            r'<span\s+class="matches__teamscores-side">\s*(\d+)\s*</span>',
-            block_html
-        )
+        scores = _SCORES_RE.findall(block_html)
 
         if len(team_names) >= 2:
             home_team = team_names[0].strip()
@@ -122,41 +191,28 @@ def parse_teams_page(html):
     """
     teams = {}  # team_name -> list of players
 
-    # Split into team sections
-    team_section_pattern = re.compile(
-        r'<div\s+class="team-lineups__list-team">(.*?)(?=<div\s+class="team-lineups__list-team">|$)',
-        re.DOTALL
-    )
-
-    for section_match in team_section_pattern.finditer(html):
-        section = section_match.group(1)
+    # Each section runs from its opening div to the next one (or the end of the page).
+    # Slicing between opener positions is a single linear scan, where a lazy
+    # match with a lookahead re-tests the opener at every character.
+    openers = list(_TEAM_SECTION_RE.finditer(html))
+    for i, opener in enumerate(openers):
+        end = openers[i + 1].start() if i + 1 < len(openers) else len(html)
+        section = html[opener.end():end]
 
         # Get team name from header
-        name_match = re.search(r'<h3\s+class="block-header__title">([^<]+)</h3>', section)
+        name_match = _TEAM_NAME_RE.search(section)
         if not name_match:
             continue
         team_name = name_match.group(1).strip()
 
         players = []
 
-        # Find all player entries
-        player_pattern = re.compile(
-            r'<li\s+class="team-lineups__list-player"[^>]*>.*?</li>',
-            re.DOTALL
-        )
-
-        for player_match in player_pattern.finditer(section):
+        for player_match in _PLAYER_LI_RE.finditer(section):
             item_html = player_match.group(0)
 
             # Extract player data
-            number_match = re.search(
-                r'team-lineups__list-player-number[^>]*>\s*(\d{1,2})\s*<',
-                item_html
-            )
-            pname_match = re.search(
-                r'team-lineups__list-player-name[^>]*>\s*(.+?)\s*<',
-                item_html
-            )
+            number_match = _NUMBER_RE.search(item_html)
+            pname_match = _PNAME_RE.search(item_html)
 
             if not (number_match and pname_match):
                 continue
@@ -172,18 +228,12 @@ def parse_teams_page(html):
 
             # Search the entire player <li> block for substitution icons + minutes
             if 'substitution_off' in item_html:
-                minute_match = re.search(
-                    r'substitution_off\.svg[^>]*>\s*(\d+)',
-                    item_html
-                )
+                minute_match = _SUB_OFF_RE.search(item_html)
                 if minute_match:
                     sub_minute_off = int(minute_match.group(1))
 
             if 'substitution_on' in item_html:
-                minute_match = re.search(
-                    r'substitution_on\.svg[^>]*>\s*(\d+)',
-                    item_html
-                )
+                minute_match = _SUB_ON_RE.search(item_html)
                 if minute_match:
                     sub_minute_on = int(minute_match.group(1))
 
@@ -208,7 +258,8 @@ def get_season_results(season):
     """Get all match results for a season from Sky Sports."""
     url = f"{BASE_URL}/rugby-union/competitions/six-nations/results/{season}"
     print(f"  Fetching results page: {url}")
-    html = fetch_html(url)
+    max_age = CURRENT_SEASON_MAX_AGE if season == AVAILABLE_SEASONS[-1] else CACHE_MAX_AGE
+    html = fetch_html(url, max_age=max_age)
     if not html:
         return []
 
@@ -274,87 +325,83 @@ def calculate_appearances(match_info, teams_data, season):
     return appearances
 
 
-def save_matches_csv(matches, filepath):
-    """Save match data to CSV."""
-    if not matches:
-        return
-    fieldnames = ["season", "date", "home_team", "away_team", "home_score", "away_score",
-                  "sky_match_id", "slug"]
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for m in matches:
-            writer.writerow({k: m.get(k, "") for k in fieldnames})
-
-
-def save_appearances_csv(appearances, filepath):
-    """Save player appearance data to CSV."""
-    if not appearances:
-        return
-    fieldnames = ["season", "date", "home_team", "away_team", "team", "player_name",
-                  "shirt_number", "position", "is_starter", "sub_minute_off",
-                  "sub_minute_on", "minutes_played", "source"]
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for a in appearances:
-            writer.writerow(a)
-
-
 def scrape_all():
-    """Scrape all available Six Nations data from Sky Sports."""
+    """Scrape all available Six Nations data from Sky Sports.
+
+    Both CSVs are opened once and rows are appended as each match is parsed,
+    rather than rewriting the whole file after every season. Rows go to temp
+    files that replace the previous CSVs only once the run completes, so a
+    crash mid-run leaves the last complete output in place.
+    """
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    all_matches = []
-    all_appearances = []
+    match_count = 0
+    appearance_count = 0
 
-    for season in AVAILABLE_SEASONS:
-        print(f"\n{'='*60}")
-        print(f"Sky Sports: Scraping season {season}")
-        print(f"{'='*60}")
+    matches_path = os.path.join(OUTPUT_DIR, "sky_matches.csv")
+    apps_path = os.path.join(OUTPUT_DIR, "sky_appearances.csv")
 
-        matches = get_season_results(season)
-        if not matches:
-            print(f"  No matches found for {season}")
-            continue
+    matches_tmp = matches_path + ".tmp"
+    apps_tmp = apps_path + ".tmp"
 
-        for i, match in enumerate(matches):
-            print(f"  [{i+1}/{len(matches)}] {match['home_team']} {match.get('home_score', '?')}-{match.get('away_score', '?')} {match['away_team']}")
+    # 1 MiB buffers: rows are written a few at a time, so let them batch up
+    with open(matches_tmp, "w", newline="", encoding="utf-8", buffering=1 << 20) as matches_f, \
+            open(apps_tmp, "w", newline="", encoding="utf-8", buffering=1 << 20) as apps_f:
+        matches_writer = csv.writer(matches_f)
+        matches_writer.writerow(MATCH_FIELDS)
+        apps_writer = csv.writer(apps_f)
+        apps_writer.writerow(APPEARANCE_FIELDS)
 
-            # Fetch teams page
-            time.sleep(1.5)
-            teams_data = get_match_teams(match["slug"], match["match_id"])
+        for season in AVAILABLE_SEASONS:
+            print(f"\n{'='*60}")
+            print(f"Sky Sports: Scraping season {season}")
+            print(f"{'='*60}")
 
-            if teams_data:
-                player_count = sum(len(p) for p in teams_data.values())
-                print(f"    Teams data: {player_count} players")
-                appearances = calculate_appearances(match, teams_data, season)
-                all_appearances.extend(appearances)
-            else:
-                print(f"    WARNING: No teams data available")
+            matches = get_season_results(season)
+            if not matches:
+                print(f"  No matches found for {season}")
+                continue
 
-            match_record = {
-                "season": season,
-                "date": "",
-                "home_team": match["home_team"],
-                "away_team": match["away_team"],
-                "home_score": match.get("home_score", ""),
-                "away_score": match.get("away_score", ""),
-                "sky_match_id": match["match_id"],
-                "slug": match["slug"],
-            }
-            all_matches.append(match_record)
-
-        # Incremental save
-        save_matches_csv(all_matches, os.path.join(OUTPUT_DIR, "sky_matches.csv"))
-        save_appearances_csv(all_appearances, os.path.join(OUTPUT_DIR, "sky_appearances.csv"))
-        print(f"  Saved: {len(all_matches)} matches, {len(all_appearances)} appearances so far")
+            # Fetch teams pages concurrently; map() keeps results in match order
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                teams_results = list(executor.map(
+                    lambda m: get_match_teams(m["slug"], m["match_id"]), matches))
+
+            for i, (match, teams_data) in enumerate(zip(matches, teams_results)):
+                print(f"  [{i+1}/{len(matches)}] {match['home_team']} {match.get('home_score', '?')}-{match.get('away_score', '?')} {match['away_team']}")
+
+                if teams_data:
+                    player_count = sum(len(p) for p in teams_data.values())
+                    print(f"    Teams data: {player_count} players")
+                    appearances = calculate_appearances(match, teams_data, season)
+                    apps_writer.writerows(tuple(a[k] for k in APPEARANCE_FIELDS) for a in appearances)
+                    appearance_count += len(appearances)
+                else:
+                    print(f"    WARNING: No teams data available")
+
+                match_record = {
+                    "season": season,
+                    "date": "",
+                    "home_team": match["home_team"],
+                    "away_team": match["away_team"],
+                    "home_score": match.get("home_score", ""),
+                    "away_score": match.get("away_score", ""),
+                    "sky_match_id": match["match_id"],
+                    "slug": match["slug"],
+                }
+                matches_writer.writerow(tuple(match_record[k] for k in MATCH_FIELDS))
+                match_count += 1
+
+            print(f"  Saved: {match_count} matches, {appearance_count} appearances so far")
+
+    os.replace(matches_tmp, matches_path)
+    os.replace(apps_tmp, apps_path)
 
     print(f"\n{'='*60}")
-    print(f"SKY SPORTS COMPLETE: {len(all_matches)} matches, {len(all_appearances)} appearances")
+    print(f"SKY SPORTS COMPLETE: {match_count} matches, {appearance_count} appearances")
     print(f"{'='*60}")
 
-    return all_matches, all_appearances
+    return match_count, appearance_count
 
 
 if __name__ == "__main__":
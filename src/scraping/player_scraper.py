@@ -6,20 +6,39 @@ Two-phase approach:
 2. Concurrently scrape individual player pages for bio details.
 """
 
+import asyncio
 import csv
 import json
 import logging
+import random
 import re
 import threading
 import time
 import unicodedata
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
+import aiohttp
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads  # optional: faster, parses bytes directly
+except ImportError:
+    _loads = json.loads
+
+try:
+    import brotli  # noqa: F401  optional: lets requests and aiohttp decode br responses
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +46,13 @@ BASE_URL = "https://www.rugbypass.com"
 PLAYERS_LIST_URL = f"{BASE_URL}/players/"
 REQUEST_TIMEOUT = 30
 CONCURRENCY = 5
+ASYNC_CONCURRENCY = CONCURRENCY  # in-flight player page requests in Phase 2
 MAX_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
 PLAYERS_PER_PAGE = 150
+LISTING_REQUEST_INTERVAL = 0.2  # seconds between listing API requests, across all threads
+DETAIL_REQUEST_INTERVAL = 0.2  # seconds between player page requests in Phase 2
+TOTAL_PAGES_MAX_AGE = 24 * 3600  # seconds a cached listing page count stays valid
 
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -40,6 +64,8 @@ HEADERS = {
     "User-Agent": USER_AGENT,
     "Accept": "*/*",
     "Accept-Language": "en-US,en;q=0.9",
+    # Only advertise brotli when it can be decoded
+    "Accept-Encoding": _ACCEPT_ENCODING,
 }
 
 AJAX_HEADERS = {
@@ -56,12 +82,50 @@ DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parents[2] / "data"
 ESPN_APPEARANCES_PATH = Path(__file__).resolve().parents[2] / "output" / "espn_appearances.csv"
 
 CSV_COLUMNS = ["name", "nationality", "age", "position", "height", "weight", "team", "slug"]
+_csv_row = attrgetter(*CSV_COLUMNS)  # Player -> tuple of CSV values, no asdict() copy
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_TOTAL_RE = re.compile(rb"total\s*:\s*(\d+)")
 
 # Thread-local storage for per-thread sessions
 _thread_local = threading.local()
 
+# Compiled XPath helpers for parse_player_details
+_TEXT_NODES = etree.XPath(".//text()[not(parent::script or parent::style)]")
+_NEXT_IMG = etree.XPath("(descendant::img | following::img)[1]")
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+class _RateLimiter:
+    """Space calls at least `interval` seconds apart across all threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
 
-@dataclass
+    def _reserve(self) -> float:
+        """Claim the next slot and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        return slot - now
+
+    def wait(self) -> None:
+        """Block until the caller's slot comes up."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """Sleep the calling task, not the event loop, until its slot comes up."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass(slots=True)
 class Player:
     name: str
     slug: str
@@ -76,18 +140,33 @@ class Player:
 def _get_session() -> requests.Session:
     """Get or create a per-thread requests session."""
     if not hasattr(_thread_local, "session"):
-        _thread_local.session = requests.Session()
-        _thread_local.session.headers.update(HEADERS)
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        # Only rugbypass.com is contacted, so one host pool is enough. Connection
+        # errors, throttling and server errors are retried with back-off inside
+        # the pool, honouring Retry-After.
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "POST"),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=CONCURRENCY, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
     return _thread_local.session
 
 
+@lru_cache(maxsize=65536)
 def _normalize_name(name: str) -> str:
     """Normalize a player name for matching: lowercase, strip accents, replace spaces with hyphens."""
     # Remove accents
     nfkd = unicodedata.normalize("NFKD", name)
     ascii_name = nfkd.encode("ascii", "ignore").decode("ascii")
     # Lowercase, replace spaces/special chars with hyphens
-    slug = re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-")
+    slug = _SLUG_RE.sub("-", ascii_name.lower()).strip("-")
     return slug
 
 
@@ -118,43 +197,73 @@ def _fetch_page_via_api(session: requests.Session, page: int) -> list[dict]:
         timeout=REQUEST_TIMEOUT,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = _loads(resp.content)
     if not data.get("success"):
         raise ValueError(f"API returned success=false for page {page}")
     return data.get("players", [])
 
 
-def _discover_total_pages(session: requests.Session) -> int:
-    """Discover total pages by fetching the listing page HTML."""
-    resp = session.get(PLAYERS_LIST_URL, timeout=REQUEST_TIMEOUT)
-    resp.raise_for_status()
-    match = re.search(r'total\s*:\s*(\d+)', resp.text)
-    return int(match.group(1)) if match else 118
+def _discover_total_pages(session: requests.Session, cache_path: Optional[Path] = None) -> int:
+    """Discover total pages by fetching the listing page HTML.
 
+    If `cache_path` holds a count written less than TOTAL_PAGES_MAX_AGE ago it is
+    used instead, and a freshly discovered count is saved there.
+    """
+    if cache_path is not None:
+        try:
+            if time.time() - cache_path.stat().st_mtime < TOTAL_PAGES_MAX_AGE:
+                return int(cache_path.read_text())
+        except (OSError, ValueError):
+            pass
 
-def fetch_player_list() -> list[Player]:
+    resp = session.get(PLAYERS_LIST_URL, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    # Search the raw bytes; the page never needs decoding
+    match = _TOTAL_RE.search(resp.content)
+    if not match:
+        return 118
+    total_pages = int(match.group(1))
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(str(total_pages))
+    return total_pages
+
+
+def fetch_player_list(output_dir: Path = DEFAULT_OUTPUT_DIR) -> list[Player]:
     """
     Phase 1: Collect all player slugs by paginating through the AJAX API.
 
     Pages are 0-indexed. The API returns 150 players per page.
     """
-    session = requests.Session()
-    session.headers.update(HEADERS)
-
-    total_pages = _discover_total_pages(session)
+    total_pages = _discover_total_pages(_get_session(), output_dir / ".total_pages")
     logger.info("Phase 1: Fetching players from %d pages...", total_pages + 1)
 
-    all_entries = []
-    for page in range(total_pages + 1):  # 0-indexed, inclusive
-        try:
-            entries = _fetch_page_via_api(session, page)
-            all_entries.extend(entries)
+    # Pages are fetched concurrently; the rate limiter keeps the overall request
+    # rate where the old sequential loop's sleep put it
+    limiter = _RateLimiter(LISTING_REQUEST_INTERVAL)
+
+    # Each worker thread builds its session once, in the pool initializer
+    def fetch_page(page: int) -> list[dict]:
+        limiter.wait()
+        return _fetch_page_via_api(_thread_local.session, page)
+
+    pages = {}
+    fetched_count = 0
+    with ThreadPoolExecutor(max_workers=CONCURRENCY, initializer=_get_session) as executor:
+        future_to_page = {executor.submit(fetch_page, page): page for page in range(total_pages + 1)}
+        for future in as_completed(future_to_page):
+            page = future_to_page[future]
+            try:
+                pages[page] = future.result()
+            except Exception as e:
+                logger.error("Failed to fetch page %d: %s", page, e)
+                continue
+            fetched_count += 1
+            if fetched_count % 10 == 0 or fetched_count == total_pages + 1:
+                logger.info("Fetched %d/%d pages", fetched_count, total_pages + 1)
 
-            if page % 10 == 0 or page == total_pages:
-                logger.info("Fetched page %d/%d (%d players so far)", page, total_pages, len(all_entries))
-            time.sleep(0.2)
-        except Exception as e:
-            logger.error("Failed to fetch page %d: %s", page, e)
+    # Reassemble in page order (0-indexed, inclusive)
+    all_entries = [entry for page in sorted(pages) for entry in pages[page]]
 
     # Deduplicate by slug
     seen = set()
@@ -174,13 +283,16 @@ def load_espn_player_names(espn_path: Path = ESPN_APPEARANCES_PATH) -> set[str]:
     if not espn_path.exists():
         logger.warning("ESPN appearances file not found: %s", espn_path)
         return set()
-    names = set()
-    with open(espn_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row.get("player_name", "").strip()
-            if name:
-                names.add(name)
+    with open(espn_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None or "player_name" not in header:
+            names = set()
+        else:
+            # Plain rows instead of DictReader: only one column is needed
+            i = header.index("player_name")
+            names = {row[i].strip() for row in reader if len(row) > i}
+            names.discard("")
     logger.info("Loaded %d unique ESPN player names", len(names))
     return names
 
@@ -205,114 +317,171 @@ def prioritize_espn_players(players: list[Player], espn_names: set[str]) -> list
     return espn_players + other_players
 
 
+def _text(el) -> str:
+    """Concatenated stripped text of an element (with each text node stripped)."""
+    return "".join(t.strip() for t in _TEXT_NODES(el))
+
+
+def _next_sibling_element(el):
+    """Next sibling element, skipping comments and processing instructions."""
+    sibling = el.getnext()
+    while sibling is not None and not isinstance(sibling.tag, str):
+        sibling = sibling.getnext()
+    return sibling
+
+
+def _next_sibling_text(el) -> Optional[str]:
+    """Raw text node right after an element (its tail, or a following comment's text)."""
+    if el.tail:
+        return el.tail
+    sibling = el.getnext()
+    if sibling is not None and not isinstance(sibling.tag, str):
+        return sibling.text
+    return None
+
+
+def _body_markup(html: str) -> str:
+    """The page from its <body> tag on, or the whole page if it can't be cut safely.
+
+    The bio fields all live in the body, so the head's inline scripts, styles and
+    metadata never need parsing.
+    """
+    start = html.find("<body")
+    # Don't cut inside a script that happens to contain "<body"
+    if start <= 0 or html.rfind("<script", 0, start) > html.rfind("</script", 0, start):
+        return html
+    return html[start:]
+
+
 def parse_player_details(html: str, player: Player) -> Player:
-    """Parse bio details from an individual player page's HTML."""
-    soup = BeautifulSoup(html, "lxml")
+    """Parse bio details from an individual player page's HTML.
+
+    Empty pages leave the player unchanged.
+    """
+    try:
+        try:
+            root = lxml.html.fromstring(_body_markup(html))
+        except ValueError:
+            # lxml refuses str input that carries an XML encoding declaration
+            root = lxml.html.fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+    except etree.ParserError:
+        return player
 
-    for h3 in soup.find_all("h3"):
-        label = h3.get_text(strip=True).lower()
+    for h3 in root.iter("h3"):
+        label = _text(h3).lower()
 
         if label == "nationality":
-            img = h3.find_next("img")
-            if img and img.get("alt"):
-                player.nationality = img["alt"]
+            img = _NEXT_IMG(h3)
+            if img and img[0].get("alt"):
+                player.nationality = img[0].get("alt")
             else:
-                sibling = h3.find_next_sibling()
-                if sibling:
-                    text = sibling.get_text(strip=True)
+                sibling = _next_sibling_element(h3)
+                if sibling is not None:
+                    text = _text(sibling)
                     if text:
                         player.nationality = text
 
         elif label == "age":
-            sibling = h3.find_next_sibling()
-            if sibling:
-                text = sibling.get_text(strip=True)
+            sibling = _next_sibling_element(h3)
+            if sibling is not None:
+                text = _text(sibling)
             else:
-                text = h3.next_sibling
+                text = _next_sibling_text(h3)
                 if text:
-                    text = str(text).strip()
-            if text and str(text).isdigit():
+                    text = text.strip()
+            if text and text.isdigit():
                 player.age = int(text)
 
-        elif label == "height":
-            sibling = h3.find_next_sibling()
-            if sibling:
-                player.height = sibling.get_text(strip=True)
+        elif label in ("height", "weight"):
+            sibling = _next_sibling_element(h3)
+            if sibling is not None:
+                setattr(player, label, _text(sibling))
             else:
-                text = h3.next_sibling
+                text = _next_sibling_text(h3)
                 if text:
-                    player.height = str(text).strip()
-
-        elif label == "weight":
-            sibling = h3.find_next_sibling()
-            if sibling:
-                player.weight = sibling.get_text(strip=True)
-            else:
-                text = h3.next_sibling
-                if text:
-                    player.weight = str(text).strip()
+                    setattr(player, label, text.strip())
 
     return player
 
 
-def _fetch_single_player(player: Player) -> Player:
-    """Fetch and parse a single player's detail page with retry (uses per-thread session)."""
-    session = _get_session()
+async def _fetch_single_player(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    limiter: _RateLimiter,
+    player: Player,
+) -> Player:
+    """Fetch and parse a single player's detail page.
+
+    Connection errors, timeouts, throttling and server errors are retried with
+    jittered exponential back-off (or the server's Retry-After); anything else,
+    including 404s, fails straight away. Every attempt, retries included,
+    waits for its slot on the shared `limiter`.
+    """
     url = f"{BASE_URL}/players/{player.slug}/"
     for attempt in range(MAX_RETRIES):
+        retry_after = None
         try:
-            resp = session.get(url, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            return parse_player_details(resp.text, player)
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(2 ** attempt)
-                continue
-            raise
+            async with semaphore:
+                await limiter.wait_async()
+                async with session.get(url) as resp:
+                    if resp.status in RETRY_STATUSES and attempt < MAX_RETRIES - 1:
+                        retry_after = resp.headers.get("Retry-After")
+                    else:
+                        resp.raise_for_status()
+                        html = await resp.text()
+                        return parse_player_details(html, player)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES - 1:
+                raise
+        delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+        await asyncio.sleep(delay + random.uniform(0, 1))
 
 
 def _load_already_scraped(csv_path: Path) -> set[str]:
     """Load slugs already present in the CSV for resume capability."""
     if not csv_path.exists():
         return set()
-    scraped = set()
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("slug"):
-                scraped.add(row["slug"])
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None or "slug" not in header:
+            return set()
+        # Plain rows instead of DictReader: only the slug column is needed
+        i = header.index("slug")
+        scraped = {row[i] for row in reader if len(row) > i and row[i]}
     logger.info("Found %d already-scraped players in CSV", len(scraped))
     return scraped
 
 
-def _append_to_csv(csv_path: Path, players: list[Player], write_header: bool) -> None:
-    """Append player rows to the CSV file."""
-    with open(csv_path, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        if write_header:
-            writer.writeheader()
-        for player in players:
-            row = asdict(player)
-            writer.writerow({col: row.get(col, "") for col in CSV_COLUMNS})
-
-
 def scrape_player_details(
     players: list[Player],
     output_dir: Path = DEFAULT_OUTPUT_DIR,
+    scraped_slugs: Optional[set[str]] = None,
 ) -> list[Player]:
     """
-    Phase 2: Scrape individual player pages for bio details using thread pool.
+    Phase 2: Scrape individual player pages for bio details with asyncio.
 
-    Uses per-thread sessions for better performance.
+    A single aiohttp session keeps up to ASYNC_CONCURRENCY requests in flight,
+    started no closer together than DETAIL_REQUEST_INTERVAL seconds.
     Saves incrementally to CSV and supports resuming.
+
+    If `scraped_slugs` is given it stands in for the slugs already in the CSV,
+    and every slug written during the run is added to it.
     """
+    return asyncio.run(_scrape_player_details_async(players, output_dir, scraped_slugs))
+
+
+async def _scrape_player_details_async(
+    players: list[Player], output_dir: Path, scraped_slugs: Optional[set[str]],
+) -> list[Player]:
     output_dir.mkdir(parents=True, exist_ok=True)
     csv_path = output_dir / "players.csv"
     failed_path = output_dir / "failed_players.txt"
 
     # Resume support
-    already_scraped = _load_already_scraped(csv_path)
-    remaining = [p for p in players if p.slug not in already_scraped]
+    if scraped_slugs is None:
+        scraped_slugs = _load_already_scraped(csv_path)
+    remaining = [p for p in players if p.slug not in scraped_slugs]
     write_header = not csv_path.exists() or csv_path.stat().st_size == 0
 
     if not remaining:
@@ -321,7 +490,7 @@ def scrape_player_details(
 
     logger.info(
         "Phase 2: Scraping details for %d players (%d already done, %d remaining)",
-        len(players), len(already_scraped), len(remaining),
+        len(players), len(scraped_slugs), len(remaining),
     )
 
     completed = []
@@ -329,34 +498,49 @@ def scrape_player_details(
     total_processed = 0
     batch_size = 100
 
-    for chunk_start in range(0, len(remaining), batch_size):
-        chunk = remaining[chunk_start:chunk_start + batch_size]
-        chunk_completed = []
-
-        with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
-            future_to_player = {executor.submit(_fetch_single_player, p): p for p in chunk}
-
-            for future in as_completed(future_to_player):
-                player = future_to_player[future]
-                try:
-                    result = future.result()
-                    chunk_completed.append(result)
-                    completed.append(result)
-                except Exception as e:
-                    failed.append(player.slug)
-                    if "404" not in str(e):
-                        logger.error("Failed to scrape %s: %s", player.slug, e)
-
-        # Save chunk to CSV
-        if chunk_completed:
-            _append_to_csv(csv_path, chunk_completed, write_header)
-            write_header = False
-
-        total_processed += len(chunk)
-        logger.info(
-            "[%d/%d] Progress: %d completed, %d failed",
-            total_processed, len(remaining), len(completed), len(failed),
-        )
+    semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    limiter = _RateLimiter(DETAIL_REQUEST_INTERVAL)
+    connector = aiohttp.TCPConnector(limit_per_host=ASYNC_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+    # CSV writes stay on this task, one batch at a time, through one long-lived writer
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+
+        async def fetch(player: Player):
+            try:
+                return player, await _fetch_single_player(session, semaphore, limiter, player), None
+            except Exception as e:
+                return player, None, e
+
+        with open(csv_path, "a", newline="", encoding="utf-8", buffering=1 << 16) as csv_file:
+            writer = csv.writer(csv_file)
+            if write_header:
+                writer.writerow(CSV_COLUMNS)
+
+            for chunk_start in range(0, len(remaining), batch_size):
+                chunk = remaining[chunk_start:chunk_start + batch_size]
+                chunk_completed = []
+
+                for next_done in asyncio.as_completed([fetch(p) for p in chunk]):
+                    player, result, error = await next_done
+                    if error is None:
+                        chunk_completed.append(result)
+                        completed.append(result)
+                    else:
+                        failed.append(player.slug)
+                        if "404" not in str(error):
+                            logger.error("Failed to scrape %s: %s", player.slug, error)
+
+                # Save chunk to CSV, flushed so an interrupted run keeps finished batches
+                writer.writerows(map(_csv_row, chunk_completed))
+                csv_file.flush()
+                scraped_slugs.update(p.slug for p in chunk_completed if p.slug)
+
+                total_processed += len(chunk)
+                logger.info(
+                    "[%d/%d] Progress: %d completed, %d failed",
+                    total_processed, len(remaining), len(completed), len(failed),
+                )
 
     # Save failed slugs
     if failed:
@@ -397,7 +581,7 @@ def scrape_all_players(output_dir: Path = DEFAULT_OUTPUT_DIR) -> list[Player]:
     # Try loading from checkpoint first
     players = load_slugs_checkpoint(output_dir)
     if players is None:
-        players = fetch_player_list()
+        players = fetch_player_list(output_dir)
         save_slugs_checkpoint(players, output_dir)
 
     # Prioritize ESPN players
@@ -405,8 +589,9 @@ def scrape_all_players(output_dir: Path = DEFAULT_OUTPUT_DIR) -> list[Player]:
     if espn_names:
         players = prioritize_espn_players(players, espn_names)
 
-    completed = scrape_player_details(players, output_dir)
+    # Kept up to date by the scrape, so the CSV isn't read back just to count it
+    scraped_slugs = _load_already_scraped(output_dir / "players.csv")
+    completed = scrape_player_details(players, output_dir, scraped_slugs)
 
-    total_in_csv = len(_load_already_scraped(output_dir / "players.csv"))
-    logger.info("Done! Total players in CSV: %d", total_in_csv)
+    logger.info("Done! Total players in CSV: %d", len(scraped_slugs))
     return completed
@@ -9,13 +9,21 @@ Usage:
 import argparse
 import datetime as dt
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
-from matplotlib.animation import FuncAnimation, PillowWriter
-import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,20 @@ ALL_INTERNATIONAL_PATH = PROJECT_ROOT / "output" / "espn_all_international_appea
 PLAYERS_PATH = PROJECT_ROOT / "data" / "players.csv"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 
+# Only these columns are read from the CSVs; the rest are skipped while parsing.
+# Low-cardinality appearance columns are read straight into categoricals.
+APPEARANCE_DTYPES = {
+    "season": "category",
+    "date": str,
+    "home_team": "category",
+    "away_team": "category",
+    "team": "category",
+    "player_name": str,
+    "shirt_number": str,
+    "position": "category",
+}
+BIOMETRIC_COLUMNS = ["name", "nationality", "height", "weight"]
+
 TEAM_NATIONALITY = {
     "France": "France",
     "Wales": "Wales",
@@ -45,6 +67,16 @@ T1_TEAMS = set(TEAM_NATIONALITY.keys())
 FORWARD_POSITIONS = {"P", "H", "L", "FL", "N8"}
 BACK_POSITIONS = {"FB", "W", "C", "FH", "SH"}
 
+# Density contour settings (seaborn kdeplot defaults, with 15 levels)
+KDE_GRIDSIZE = 200
+KDE_CUT = 3
+KDE_LEVELS = 15
+KDE_THRESH = 0.05
+KDE_BINNED_MIN_POINTS = 50  # from here on, binning + FFT beats summing every kernel
+KDE_MIN_VARIANCE = 1e-6  # kg² / cm²; below this a frame is treated as constant
+
+MERGE_POOL_MIN_FRAMES = 4  # below this, worker start-up outweighs the merges
+
 
 def classify_position_group(position: str, shirt_number: str) -> str:
     """Classify a player as 'Forward' or 'Back' from position code and shirt number."""
@@ -60,33 +92,68 @@ def classify_position_group(position: str, shirt_number: str) -> str:
         return "Unknown"
 
 
+def classify_position_group_series(position: pd.Series, shirt_number: pd.Series) -> pd.Series:
+    """Column-wise classify_position_group over aligned position and shirt number columns."""
+    num = pd.to_numeric(shirt_number, errors="coerce")
+    conditions = [
+        position.isin(FORWARD_POSITIONS),
+        position.isin(BACK_POSITIONS),
+        num <= 20,
+        num.notna(),
+    ]
+    choices = ["Forward", "Back", "Forward", "Back"]
+    return pd.Series(np.select(conditions, choices, default="Unknown"), index=position.index)
+
+
+def _position_groups(apps_df: pd.DataFrame) -> dict[str, str]:
+    """Map each player to the position group of their first appearance in apps_df."""
+    first = apps_df.drop_duplicates("player_name")
+    groups = classify_position_group_series(first["position"], first["shirt_number"])
+    return dict(zip(first["player_name"], groups))
+
+
 def load_appearances() -> pd.DataFrame:
     """Load the full appearances CSV."""
-    return pd.read_csv(APPEARANCES_PATH, dtype=str)
+    return pd.read_csv(APPEARANCES_PATH, usecols=list(APPEARANCE_DTYPES), dtype=APPEARANCE_DTYPES)
 
 
 def load_player_biometrics() -> pd.DataFrame:
-    """Load players.csv and parse height/weight to numeric columns."""
-    df = pd.read_csv(PLAYERS_PATH, dtype=str)
+    """Load players.csv and parse height/weight to numeric columns.
+
+    The parsed table is cached per path, so repeated animation and trend runs
+    read the file once; each caller gets its own shallow copy.
+    """
+    return _read_player_biometrics(PLAYERS_PATH).copy(deep=False)
+
+
+@lru_cache(maxsize=1)
+def _read_player_biometrics(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path, usecols=BIOMETRIC_COLUMNS, dtype=str)
     df["height_cm"] = pd.to_numeric(
-        df["height"].str.replace("cm", "", regex=False), errors="coerce"
+        df["height"].str.replace("cm", "", regex=False), errors="coerce", downcast="float"
     )
     df["weight_kg"] = pd.to_numeric(
-        df["weight"].str.replace("kg", "", regex=False), errors="coerce"
+        df["weight"].str.replace("kg", "", regex=False), errors="coerce", downcast="float"
     )
     return df
 
 
 def merge_players(players_df: pd.DataFrame, bio_df: pd.DataFrame) -> pd.DataFrame:
     """Join players with biometrics, disambiguating duplicate names."""
+    # Only this round's names and the columns used below take part in the join
+    bio_df = bio_df.loc[
+        bio_df["name"].isin(players_df["player_name"]),
+        ["name", "nationality", "height_cm", "weight_kg"],
+    ]
     merged = players_df.merge(
         bio_df, left_on="player_name", right_on="name", how="left", suffixes=("", "_bio")
     )
 
-    merged["nationality_match"] = merged.apply(
-        lambda row: row.get("nationality") == TEAM_NATIONALITY.get(row["team"], ""),
-        axis=1,
-    )
+    # Missing nationalities are NaN, which never compare equal, as before.
+    # Mapped as object: a categorical team maps to a categorical, which
+    # refuses to fill with a value that is not one of its categories.
+    expected_nationality = merged["team"].astype(object).map(TEAM_NATIONALITY).fillna("")
+    merged["nationality_match"] = merged["nationality"] == expected_nationality
     merged["has_biometrics"] = merged["height_cm"].notna() & merged["weight_kg"].notna()
 
     merged = merged.sort_values(
@@ -104,6 +171,31 @@ def merge_players(players_df: pd.DataFrame, bio_df: pd.DataFrame) -> pd.DataFram
     return merged.loc[good, keep_cols].reset_index(drop=True)
 
 
+# Biometrics table of a merge worker process, set once by _init_merge_worker
+_worker_bio_df: pd.DataFrame | None = None
+
+
+def _init_merge_worker(bio_df: pd.DataFrame) -> None:
+    global _worker_bio_df
+    _worker_bio_df = bio_df
+
+
+def _merge_players_worker(players_df: pd.DataFrame) -> pd.DataFrame:
+    return merge_players(players_df, _worker_bio_df)
+
+
+def merge_all_players(players_list: list[pd.DataFrame], bio_df: pd.DataFrame) -> list[pd.DataFrame]:
+    """merge_players for every frame's players, in order.
+
+    Frames are independent, so they merge in worker processes when there are
+    enough of them and more than one CPU; bio_df is sent to each worker once.
+    """
+    if len(players_list) < MERGE_POOL_MIN_FRAMES or (os.cpu_count() or 1) < 2:
+        return [merge_players(players, bio_df) for players in players_list]
+    with ProcessPoolExecutor(initializer=_init_merge_worker, initargs=(bio_df,)) as ex:
+        return list(ex.map(_merge_players_worker, players_list))
+
+
 def group_into_rounds(apps_df: pd.DataFrame) -> list[dict]:
     """Group appearances into rounds by season and date clusters.
 
@@ -111,27 +203,19 @@ def group_into_rounds(apps_df: pd.DataFrame) -> list[dict]:
     Returns a list of dicts with 'season', 'round', 'dates', sorted chronologically.
     """
     rounds = []
-    for season in sorted(apps_df["season"].unique()):
-        season_df = apps_df[apps_df["season"] == season]
-        dates = sorted(season_df["date"].unique())
-        parsed = [dt.date.fromisoformat(d) for d in dates]
-
-        # Cluster dates within 3 days of each other
-        clusters: list[list[str]] = []
-        current_cluster = [dates[0]]
-        for i in range(1, len(dates)):
-            if (parsed[i] - parsed[i - 1]).days <= 3:
-                current_cluster.append(dates[i])
-            else:
-                clusters.append(current_cluster)
-                current_cluster = [dates[i]]
-        clusters.append(current_cluster)
-
-        for round_num, date_cluster in enumerate(clusters, 1):
+    for season, season_dates in apps_df.groupby("season", observed=True)["date"].unique().items():
+        dates = sorted(season_dates)
+
+        # Cluster dates within 3 days of each other: a longer gap starts a new round
+        days = np.array(dates, dtype="datetime64[D]")
+        starts = np.flatnonzero(np.diff(days) > np.timedelta64(3, "D")) + 1
+        bounds = [0, *starts.tolist(), len(dates)]
+
+        for round_num, (start, end) in enumerate(zip(bounds, bounds[1:]), 1):
             rounds.append({
                 "season": season,
                 "round": round_num,
-                "dates": date_cluster,
+                "dates": dates[start:end],
             })
 
     return rounds
@@ -142,20 +226,111 @@ def _format_season_label(season: str) -> str:
     return season.replace("-", "/")
 
 
+def _kde_grid(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Gaussian KDE of weight vs height on a grid, as sns.kdeplot evaluates it.
+
+    Uses Scott's bandwidth over the full data covariance and a KDE_GRIDSIZE
+    square grid reaching KDE_CUT bandwidths past the data. Returns
+    (weight_grid, height_grid, density), or None when the data is degenerate.
+    """
+    data = df[["weight_kg", "height_cm"]].dropna().to_numpy(dtype=float).T
+    n = data.shape[1]
+    if n < 2 or data.var(axis=1, ddof=1).min() < KDE_MIN_VARIANCE:
+        return None
+
+    factor = n ** (-1 / 6)  # Scott's rule for two dimensions
+    covariance = np.cov(data) * factor**2
+    try:
+        inv_cov = np.linalg.inv(covariance)
+        whitening = np.linalg.cholesky(inv_cov)
+    except np.linalg.LinAlgError:
+        return None
+    norm = np.sqrt(np.linalg.det(2 * np.pi * covariance))
+
+    bandwidth = np.sqrt(np.diag(covariance))
+    low = data.min(axis=1) - KDE_CUT * bandwidth
+    high = data.max(axis=1) + KDE_CUT * bandwidth
+    weight_grid = np.linspace(low[0], high[0], KDE_GRIDSIZE)
+    height_grid = np.linspace(low[1], high[1], KDE_GRIDSIZE)
+
+    if n >= KDE_BINNED_MIN_POINTS:
+        density = _binned_kernel_sum(data, low, high, covariance, inv_cov)
+    else:
+        # Sum one kernel per player over the whole grid, in whitened coordinates
+        ww, hh = np.meshgrid(weight_grid, height_grid)
+        points = whitening.T @ np.vstack([ww.ravel(), hh.ravel()])
+        scaled = whitening.T @ data
+        density = np.zeros(points.shape[1])
+        for i in range(n):
+            diff = points - scaled[:, i, np.newaxis]
+            density += np.exp(-0.5 * np.einsum("ij,ij->j", diff, diff))
+        density = density.reshape(ww.shape)
+    return weight_grid, height_grid, density / (n * norm)
+
+
+def _binned_kernel_sum(
+    data: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
+    covariance: np.ndarray,
+    inv_cov: np.ndarray,
+) -> np.ndarray:
+    """Approximate the per-player kernel sum on the KDE grid by binning and FFT convolution.
+
+    Points are linearly binned onto the grid nodes and the binned counts are
+    convolved with the kernel, truncated at 5 bandwidths. Linear in the number
+    of players; within about 0.1% of the exact sum at the default grid size.
+    """
+    size = KDE_GRIDSIZE
+    step = (high - low) / (size - 1)
+
+    # Linear binning: each point's weight goes to its four surrounding nodes,
+    # indexed [height, weight] like the meshgrid in _kde_grid
+    pos = (data - low[:, np.newaxis]) / step[:, np.newaxis]
+    base = np.clip(np.floor(pos).astype(int), 0, size - 2)
+    frac = pos - base
+    counts = np.zeros((size, size))
+    for dw in (0, 1):
+        for dh in (0, 1):
+            share = (frac[0] if dw else 1 - frac[0]) * (frac[1] if dh else 1 - frac[1])
+            np.add.at(counts, (base[1] + dh, base[0] + dw), share)
+
+    # Kernel values at every node offset within the truncation radius
+    radius = np.minimum(np.ceil(5 * np.sqrt(np.diag(covariance)) / step).astype(int), size - 1)
+    dw, dh = np.meshgrid(
+        np.arange(-radius[0], radius[0] + 1) * step[0],
+        np.arange(-radius[1], radius[1] + 1) * step[1],
+    )
+    energy = inv_cov[0, 0] * dw * dw + 2 * inv_cov[0, 1] * dw * dh + inv_cov[1, 1] * dh * dh
+    kernel = np.exp(-0.5 * energy)
+
+    shape = (size + 2 * radius[1], size + 2 * radius[0])
+    summed = np.fft.irfft2(np.fft.rfft2(counts, shape) * np.fft.rfft2(kernel, shape), shape)
+    # Round-off can leave tiny negatives far from any player
+    return np.maximum(summed[radius[1]:radius[1] + size, radius[0]:radius[0] + size], 0)
+
+
+def _draw_kde(ax, kde_grid: tuple[np.ndarray, np.ndarray, np.ndarray] | None):
+    """Fill KDE_LEVELS density contours, from the densest region out to KDE_THRESH of the mass.
+
+    Returns the ContourSet, or None if there is no density to draw.
+    """
+    if kde_grid is None:
+        return None
+    weight_grid, height_grid, density = kde_grid
+    # Iso-proportion levels converted to densities, as seaborn does
+    ordered = np.sort(density.ravel())[::-1]
+    mass = np.cumsum(ordered) / ordered.sum()
+    cuts = np.searchsorted(mass, 1 - np.linspace(KDE_THRESH, 1, KDE_LEVELS))
+    levels = ordered.take(cuts, mode="clip")
+    return ax.contourf(weight_grid, height_grid, density, levels=levels, cmap="YlOrRd", alpha=0.7)
+
+
 def create_heatmap(df: pd.DataFrame, output_path: Path) -> None:
     """Render a filled KDE heatmap with scatter overlay and save to disk."""
     fig, ax = plt.subplots(figsize=(10, 8))
 
-    sns.kdeplot(
-        data=df,
-        x="weight_kg",
-        y="height_cm",
-        fill=True,
-        cmap="YlOrRd",
-        levels=15,
-        alpha=0.7,
-        ax=ax,
-    )
+    _draw_kde(ax, _kde_grid(df))
 
     ax.scatter(
         df["weight_kg"],
@@ -191,40 +366,69 @@ def create_heatmap(df: pd.DataFrame, output_path: Path) -> None:
     logger.info("Saved heatmap to %s", output_path)
 
 
-def _median_cog(df: pd.DataFrame) -> tuple[float, float]:
-    """Return (median weight, median height) or (nan, nan) if empty."""
-    if len(df) >= 1:
-        return df["weight_kg"].median(), df["height_cm"].median()
-    return float("nan"), float("nan")
+def _median_cogs(
+    round_data: list[tuple[str, pd.DataFrame]], groups: list[str] | None = None
+) -> pd.DataFrame:
+    """Median weight_kg and height_cm of every frame, one row per frame index.
 
+    With `groups`, medians are taken per position group and the columns are
+    (measure, group) pairs. Frames or groups without players get NaN.
+    """
+    frames = pd.concat(
+        [df.assign(frame=i) for i, (_, df) in enumerate(round_data)], ignore_index=True
+    )
+    measures = ["weight_kg", "height_cm"]
+    if groups is None:
+        medians = frames.groupby("frame")[measures].median()
+    else:
+        medians = frames.groupby(["frame", "position_group"])[measures].median()
+        medians = medians.unstack("position_group").reindex(
+            columns=pd.MultiIndex.from_product([measures, groups])
+        )
+    return medians.reindex(range(len(round_data)))
+
+
+def _axis_limits(round_data: list[tuple[str, pd.DataFrame]]) -> tuple[float, float, float, float]:
+    """Padded (weight_min, weight_max, height_min, height_max) across all frames."""
+    # Reduce per-frame extremes rather than concatenating every frame;
+    # empty frames give NaN, which nanmin/nanmax skip
+    frames = [d for _, d in round_data]
+    return (
+        np.nanmin([d["weight_kg"].min() for d in frames]) - 5,
+        np.nanmax([d["weight_kg"].max() for d in frames]) + 5,
+        np.nanmin([d["height_cm"].min() for d in frames]) - 3,
+        np.nanmax([d["height_cm"].max() for d in frames]) + 3,
+    )
 
-def _draw_trail_and_marker(
-    ax,
+
+def _trail_segments(
     trail: list[tuple[float, float]],
     frame_idx: int,
     trail_length: int,
     color: str,
-    label_text: str,
-    y_offset: int = -15,
-) -> None:
-    """Draw a fading trail and current CoG marker for one group."""
+) -> tuple[np.ndarray, np.ndarray]:
+    """Segments and RGBA colours of the fading trail leading up to frame_idx for one group."""
     trail_start = max(0, frame_idx - trail_length + 1)
-    trail_segment = trail[trail_start : frame_idx + 1]
-    for i in range(len(trail_segment) - 1):
-        age = len(trail_segment) - 1 - i
-        alpha = max(0.08, 1.0 - age / trail_length)
-        w0, h0 = trail_segment[i]
-        w1, h1 = trail_segment[i + 1]
-        ax.plot([w0, w1], [h0, h1], color=color, linewidth=2, alpha=alpha, zorder=9)
-
-    cog_w, cog_h = trail[frame_idx]
-    ax.scatter(
-        cog_w, cog_h, color=color, s=200, marker="X",
+    points = np.asarray(trail[trail_start : frame_idx + 1], dtype=float).reshape(-1, 2)
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+    # Segment i is (len(segments) - i) frames old; older segments fade out
+    age = np.arange(len(segments), 0, -1)
+    colors = np.tile(mcolors.to_rgba(color), (len(segments), 1))
+    colors[:, 3] = np.maximum(0.08, 1.0 - age / trail_length)
+    return segments, colors
+
+
+def _cog_artists(ax, color: str, y_offset: int = -15):
+    """Create the trail, CoG marker and marker label for one group, to be updated each frame."""
+    trail_lines = LineCollection([], linewidths=2, capstyle="projecting", zorder=9)
+    ax.add_collection(trail_lines, autolim=False)
+    marker = ax.scatter(
+        [], [], color=color, s=200, marker="X",
         zorder=10, edgecolors="white", linewidths=1.5,
     )
-    ax.annotate(
-        label_text,
-        (cog_w, cog_h),
+    label = ax.annotate(
+        "",
+        (0, 0),
         xytext=(12, y_offset),
         textcoords="offset points",
         fontsize=11,
@@ -233,136 +437,171 @@ def _draw_trail_and_marker(
         zorder=11,
         bbox=dict(boxstyle="round,pad=0.3", fc=color, alpha=0.8),
     )
+    return trail_lines, marker, label
 
 
-def create_animation(output_path: Path, split_position: bool = False) -> None:
-    """Create an animated GIF with one frame per round across all seasons."""
-    apps_df = load_appearances()
-    bio_df = load_player_biometrics()
-    rounds = group_into_rounds(apps_df)
-
-    # Pre-compute merged data for each round
-    round_data: list[tuple[str, pd.DataFrame]] = []
-    for r in rounds:
-        mask = (apps_df["season"] == r["season"]) & (apps_df["date"].isin(r["dates"]))
-        round_apps = apps_df.loc[mask]
-        players = round_apps[["player_name", "team"]].drop_duplicates()
-
-        if split_position:
-            # Build position_group per player from their appearance data
-            pos_map = {}
-            for _, row in round_apps.iterrows():
-                name = row["player_name"]
-                if name not in pos_map:
-                    pos_map[name] = classify_position_group(
-                        row.get("position", ""), row.get("shirt_number", "")
-                    )
-            players = players.copy()
-            players["position_group"] = players["player_name"].map(pos_map)
-
-        merged = merge_players(players, bio_df)
-        year = r["dates"][0][:4]
-        label = f"{year} R{r['round']}"
-        round_data.append((label, merged))
-        logger.info("%s: %d players with biometrics", label, len(merged))
+def _render_animation(
+    round_data: list[tuple[str, pd.DataFrame]],
+    output_path: Path,
+    split_position: bool,
+    title: str,
+    trail_length: int,
+    fps: int,
+) -> None:
+    """Render one heatmap frame per (label, players) entry and save the GIF.
 
+    `title` is formatted with each frame's label.
+    """
     # Compute fixed axis limits from all data with tight padding
-    all_merged = pd.concat([d for _, d in round_data], ignore_index=True)
-    weight_min = all_merged["weight_kg"].min() - 5
-    weight_max = all_merged["weight_kg"].max() + 5
-    height_min = all_merged["height_cm"].min() - 3
-    height_max = all_merged["height_cm"].max() + 3
+    weight_min, weight_max, height_min, height_max = _axis_limits(round_data)
 
-    TRAIL_LENGTH = 20
+    # Every frame's density grid is computed once, up front
+    kde_grids = [_kde_grid(df) if len(df) >= 2 else None for _, df in round_data]
 
+    # (trail, colour, label prefix, label offset) for each centre-of-gravity marker
     if split_position:
-        fwd_trail = [_median_cog(d[d["position_group"] == "Forward"]) for _, d in round_data]
-        back_trail = [_median_cog(d[d["position_group"] == "Back"]) for _, d in round_data]
+        medians = _median_cogs(round_data, ["Forward", "Back"])
+        fwd_trail = list(zip(medians["weight_kg", "Forward"], medians["height_cm", "Forward"]))
+        back_trail = list(zip(medians["weight_kg", "Back"], medians["height_cm", "Back"]))
+        groups = [(fwd_trail, "red", "Fwd ", -18), (back_trail, "green", "Back ", 12)]
     else:
-        combined_trail = [_median_cog(d) for _, d in round_data]
-
-    fig, ax = plt.subplots(figsize=(10, 8))
+        medians = _median_cogs(round_data)
+        combined_trail = list(zip(medians["weight_kg"], medians["height_cm"]))
+        groups = [(combined_trail, "blue", "", -15)]
+
+    # Frames are blitted and grabbed straight from an Agg canvas, whatever the
+    # pyplot backend, so the buffer is always figure-sized RGBA at 1:1 pixels
+    fig = Figure(figsize=(10, 8))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.subplots()
     fig.subplots_adjust(top=0.90, bottom=0.12)
 
+    # Layout and the artists shared by every frame are created once; each frame
+    # updates them and replaces only its contour set
+    ax.set_xlim(weight_min, weight_max)
+    ax.set_ylim(height_min, height_max)
+    ax.set_xlabel("Weight (kg)", fontsize=13)
+    ax.set_ylabel("Height (cm)", fontsize=13)
+    ax.xaxis.set_major_locator(ticker.MultipleLocator(10))
+    ax.yaxis.set_major_locator(ticker.MultipleLocator(5))
+    title_text = ax.set_title("", fontsize=15)
+    count_text = ax.text(
+        0.5,
+        -0.02,
+        "",
+        transform=ax.transAxes,
+        ha="center",
+        fontsize=10,
+        color="gray",
+    )
+    scatter = ax.scatter(
+        [],
+        [],
+        color="black",
+        s=15,
+        alpha=0.6,
+        zorder=5,
+        edgecolors="white",
+        linewidths=0.5,
+    )
+    cog_artists = [_cog_artists(ax, color, y_offset) for _, color, _, y_offset in groups]
+    contours = None
+
+    # Everything that changes between frames, plus the spines that must stay on
+    # top of the contours, in the axes' own draw order. The rest of the figure
+    # (background, ticks, tick labels, axis labels) is rendered once below.
+    frame_layers = sorted(
+        [*ax.spines.values(), count_text, title_text, scatter, *chain.from_iterable(cog_artists)],
+        key=lambda artist: artist.get_zorder(),
+    )
+    for artist in frame_layers:
+        artist.set_animated(True)
+
     def draw_frame(frame_idx: int) -> None:
-        ax.clear()
+        nonlocal contours
         label, df = round_data[frame_idx]
+        if contours is not None:
+            contours.remove()
+        contours = _draw_kde(ax, kde_grids[frame_idx])
+
+        scatter.set_offsets(np.column_stack([df["weight_kg"], df["height_cm"]]))
+
+        for (trail, color, prefix, _), (trail_lines, marker, marker_label) in zip(groups, cog_artists):
+            segments, colors = _trail_segments(trail, frame_idx, trail_length, color)
+            trail_lines.set_segments(segments)
+            trail_lines.set_color(colors)
+            cog_w, cog_h = trail[frame_idx]
+            marker.set_offsets([[cog_w, cog_h]])
+            marker_label.xy = (cog_w, cog_h)
+            marker_label.set_text(f"{prefix}{cog_w:.0f}kg, {cog_h:.0f}cm")
+
+        title_text.set_text(title.format(label=label))
+        count_text.set_text(f"{len(df)} players with biometric data")
+
+    # Everything not in a frame layer is fixed once the axes are laid out, and
+    # an Agg canvas never resizes, so the background is captured just once
+    canvas.draw()
+    static_background = canvas.copy_from_bbox(fig.bbox)
+
+    # Draw each frame's layers over the static background and quantize the
+    # result to its own 256-colour palette as it is grabbed. The fast octree
+    # quantizer is within a level or two of the median cut Pillow's GIF writer
+    # would otherwise run on every frame, at a fraction of the cost.
+    frames = []
+    for frame_idx in range(len(round_data)):
+        draw_frame(frame_idx)
+        canvas.restore_region(static_background)
+        if contours is not None:
+            ax.draw_artist(contours)
+        for artist in frame_layers:
+            ax.draw_artist(artist)
+        rgb = Image.fromarray(np.asarray(canvas.buffer_rgba())[..., :3])
+        frames.append(rgb.quantize(256, method=Image.Quantize.FASTOCTREE))
+
+    frames[0].save(
+        output_path, save_all=True, append_images=frames[1:], duration=1000 // fps, loop=0
+    )
 
-        if len(df) >= 2:
-            sns.kdeplot(
-                data=df,
-                x="weight_kg",
-                y="height_cm",
-                fill=True,
-                cmap="YlOrRd",
-                levels=15,
-                alpha=0.7,
-                ax=ax,
-            )
 
-        ax.scatter(
-            df["weight_kg"],
-            df["height_cm"],
-            color="black",
-            s=15,
-            alpha=0.6,
-            zorder=5,
-            edgecolors="white",
-            linewidths=0.5,
-        )
+def create_animation(output_path: Path, split_position: bool = False) -> None:
+    """Create an animated GIF with one frame per round across all seasons."""
+    apps_df = load_appearances()
+    bio_df = load_player_biometrics()
+    rounds = group_into_rounds(apps_df)
+
+    # Tag each appearance with the index of its round, so one groupby yields
+    # every round's rows instead of a full-table mask per round
+    round_of_date = {(r["season"], d): i for i, r in enumerate(rounds) for d in r["dates"]}
+    round_key = [round_of_date[key] for key in zip(apps_df["season"], apps_df["date"])]
+
+    labels: list[str] = []
+    players_list: list[pd.DataFrame] = []
+    for r, (_, round_apps) in zip(rounds, apps_df.groupby(round_key)):
+        players = round_apps[["player_name", "team"]].drop_duplicates()
 
         if split_position:
-            fw = fwd_trail[frame_idx]
-            bk = back_trail[frame_idx]
-            _draw_trail_and_marker(
-                ax, fwd_trail, frame_idx, TRAIL_LENGTH,
-                color="red",
-                label_text=f"Fwd {fw[0]:.0f}kg, {fw[1]:.0f}cm",
-                y_offset=-18,
-            )
-            _draw_trail_and_marker(
-                ax, back_trail, frame_idx, TRAIL_LENGTH,
-                color="green",
-                label_text=f"Back {bk[0]:.0f}kg, {bk[1]:.0f}cm",
-                y_offset=12,
-            )
-        else:
-            cog = combined_trail[frame_idx]
-            _draw_trail_and_marker(
-                ax, combined_trail, frame_idx, TRAIL_LENGTH,
-                color="blue",
-                label_text=f"{cog[0]:.0f}kg, {cog[1]:.0f}cm",
+            # Build position_group per player from their appearance data
+            players = players.assign(
+                position_group=players["player_name"].map(_position_groups(round_apps))
             )
 
-        ax.set_xlim(weight_min, weight_max)
-        ax.set_ylim(height_min, height_max)
-        ax.set_xlabel("Weight (kg)", fontsize=13)
-        ax.set_ylabel("Height (cm)", fontsize=13)
-        ax.set_title(
-            f"Six Nations {label} \u2014 Player Height vs Weight",
-            fontsize=15,
-        )
-        ax.xaxis.set_major_locator(ticker.MultipleLocator(10))
-        ax.yaxis.set_major_locator(ticker.MultipleLocator(5))
-        ax.text(
-            0.5,
-            -0.02,
-            f"{len(df)} players with biometric data",
-            transform=ax.transAxes,
-            ha="center",
-            fontsize=10,
-            color="gray",
-        )
+        year = r["dates"][0][:4]
+        labels.append(f"{year} R{r['round']}")
+        players_list.append(players)
 
-    anim = FuncAnimation(
-        fig,
-        draw_frame,
-        frames=len(round_data),
-        interval=500,
-        repeat=True,
+    # Merge every round's players with biometrics at once
+    round_data = list(zip(labels, merge_all_players(players_list, bio_df)))
+    for label, merged in round_data:
+        logger.info("%s: %d players with biometrics", label, len(merged))
+
+    _render_animation(
+        round_data,
+        output_path,
+        split_position,
+        title="Six Nations {label} \u2014 Player Height vs Weight",
+        trail_length=20,
+        fps=2,
     )
-    anim.save(str(output_path), writer=PillowWriter(fps=2))
-    plt.close(fig)
     logger.info("Saved animation to %s", output_path)
 
 
@@ -370,9 +609,18 @@ def _load_t1_monthly_data() -> tuple[list[str], list[tuple[str, pd.DataFrame]]]:
     """Load T1-vs-T1 appearances, classify positions, group by month.
 
     Returns (months, round_data) where round_data is [(label, merged_df), ...].
+    The result is cached per input path, so the trend charts and the T1
+    animation share one load when run together; callers must not modify it.
     """
-    apps_df = pd.read_csv(ALL_INTERNATIONAL_PATH, dtype=str)
-    bio_df = load_player_biometrics()
+    return _read_t1_monthly_data(ALL_INTERNATIONAL_PATH, PLAYERS_PATH)
+
+
+@lru_cache(maxsize=1)
+def _read_t1_monthly_data(
+    apps_path: Path, players_path: Path
+) -> tuple[list[str], list[tuple[str, pd.DataFrame]]]:
+    apps_df = pd.read_csv(apps_path, usecols=list(APPEARANCE_DTYPES), dtype=APPEARANCE_DTYPES)
+    bio_df = _read_player_biometrics(players_path)
 
     t1_mask = apps_df["home_team"].isin(T1_TEAMS) & apps_df["away_team"].isin(T1_TEAMS)
     apps_df = apps_df[t1_mask].copy()
@@ -381,25 +629,20 @@ def _load_t1_monthly_data() -> tuple[list[str], list[tuple[str, pd.DataFrame]]]:
     apps_df["month"] = apps_df["date"].str[:7]
     months = sorted(apps_df["month"].unique())
 
-    round_data: list[tuple[str, pd.DataFrame]] = []
-    for month in months:
-        month_apps = apps_df[apps_df["month"] == month]
+    labels: list[str] = []
+    players_list: list[pd.DataFrame] = []
+    for month, month_apps in apps_df.groupby("month"):
         players = month_apps[["player_name", "team"]].drop_duplicates()
+        players = players.assign(
+            position_group=players["player_name"].map(_position_groups(month_apps))
+        )
 
-        pos_map = {}
-        for _, row in month_apps.iterrows():
-            name = row["player_name"]
-            if name not in pos_map:
-                pos_map[name] = classify_position_group(
-                    row.get("position", ""), row.get("shirt_number", "")
-                )
-        players = players.copy()
-        players["position_group"] = players["player_name"].map(pos_map)
-
-        merged = merge_players(players, bio_df)
         d = dt.date.fromisoformat(month + "-01")
-        label = d.strftime("%b %Y")
-        round_data.append((label, merged))
+        labels.append(d.strftime("%b %Y"))
+        players_list.append(players)
+
+    round_data = list(zip(labels, merge_all_players(players_list, bio_df)))
+    for label, merged in round_data:
         logger.info("%s: %d players with biometrics", label, len(merged))
 
     return months, round_data
@@ -409,103 +652,14 @@ def create_t1_animation(output_path: Path, split_position: bool = False) -> None
     """Create an animated GIF of T1-vs-T1 matches, one frame per month."""
     months, round_data = _load_t1_monthly_data()
 
-    # Compute fixed axis limits
-    all_merged = pd.concat([d for _, d in round_data], ignore_index=True)
-    weight_min = all_merged["weight_kg"].min() - 5
-    weight_max = all_merged["weight_kg"].max() + 5
-    height_min = all_merged["height_cm"].min() - 3
-    height_max = all_merged["height_cm"].max() + 3
-
-    TRAIL_LENGTH = 40
-
-    if split_position:
-        fwd_trail = [_median_cog(d[d["position_group"] == "Forward"]) for _, d in round_data]
-        back_trail = [_median_cog(d[d["position_group"] == "Back"]) for _, d in round_data]
-    else:
-        combined_trail = [_median_cog(d) for _, d in round_data]
-
-    fig, ax = plt.subplots(figsize=(10, 8))
-    fig.subplots_adjust(top=0.90, bottom=0.12)
-
-    def draw_frame(frame_idx: int) -> None:
-        ax.clear()
-        label, df = round_data[frame_idx]
-
-        if len(df) >= 2:
-            sns.kdeplot(
-                data=df,
-                x="weight_kg",
-                y="height_cm",
-                fill=True,
-                cmap="YlOrRd",
-                levels=15,
-                alpha=0.7,
-                ax=ax,
-            )
-
-        ax.scatter(
-            df["weight_kg"],
-            df["height_cm"],
-            color="black",
-            s=15,
-            alpha=0.6,
-            zorder=5,
-            edgecolors="white",
-            linewidths=0.5,
-        )
-
-        if split_position:
-            fw = fwd_trail[frame_idx]
-            bk = back_trail[frame_idx]
-            _draw_trail_and_marker(
-                ax, fwd_trail, frame_idx, TRAIL_LENGTH,
-                color="red",
-                label_text=f"Fwd {fw[0]:.0f}kg, {fw[1]:.0f}cm",
-                y_offset=-18,
-            )
-            _draw_trail_and_marker(
-                ax, back_trail, frame_idx, TRAIL_LENGTH,
-                color="green",
-                label_text=f"Back {bk[0]:.0f}kg, {bk[1]:.0f}cm",
-                y_offset=12,
-            )
-        else:
-            cog = combined_trail[frame_idx]
-            _draw_trail_and_marker(
-                ax, combined_trail, frame_idx, TRAIL_LENGTH,
-                color="blue",
-                label_text=f"{cog[0]:.0f}kg, {cog[1]:.0f}cm",
-            )
-
-        ax.set_xlim(weight_min, weight_max)
-        ax.set_ylim(height_min, height_max)
-        ax.set_xlabel("Weight (kg)", fontsize=13)
-        ax.set_ylabel("Height (cm)", fontsize=13)
-        ax.set_title(
-            f"T1 International Rugby {label} \u2014 Player Height vs Weight",
-            fontsize=15,
-        )
-        ax.xaxis.set_major_locator(ticker.MultipleLocator(10))
-        ax.yaxis.set_major_locator(ticker.MultipleLocator(5))
-        ax.text(
-            0.5,
-            -0.02,
-            f"{len(df)} players with biometric data",
-            transform=ax.transAxes,
-            ha="center",
-            fontsize=10,
-            color="gray",
-        )
-
-    anim = FuncAnimation(
-        fig,
-        draw_frame,
-        frames=len(round_data),
-        interval=333,
-        repeat=True,
+    _render_animation(
+        round_data,
+        output_path,
+        split_position,
+        title="T1 International Rugby {label} \u2014 Player Height vs Weight",
+        trail_length=40,
+        fps=3,
     )
-    anim.save(str(output_path), writer=PillowWriter(fps=3))
-    plt.close(fig)
     logger.info("Saved T1 animation to %s (%d frames)", output_path, len(round_data))
 
 
@@ -515,15 +669,11 @@ def create_t1_trend_charts(output_dir: Path) -> None:
 
     dates = [dt.date.fromisoformat(m + "-01") for m in months]
 
-    fwd_height, fwd_weight = [], []
-    back_height, back_weight = [], []
-    for _, df in round_data:
-        fwd = df[df["position_group"] == "Forward"]
-        bck = df[df["position_group"] == "Back"]
-        fwd_height.append(fwd["height_cm"].median() if len(fwd) else float("nan"))
-        fwd_weight.append(fwd["weight_kg"].median() if len(fwd) else float("nan"))
-        back_height.append(bck["height_cm"].median() if len(bck) else float("nan"))
-        back_weight.append(bck["weight_kg"].median() if len(bck) else float("nan"))
+    medians = _median_cogs(round_data, ["Forward", "Back"])
+    fwd_height = medians["height_cm", "Forward"].tolist()
+    fwd_weight = medians["weight_kg", "Forward"].tolist()
+    back_height = medians["height_cm", "Back"].tolist()
+    back_weight = medians["weight_kg", "Back"].tolist()
 
     # --- Median Height chart ---
     fig, ax = plt.subplots(figsize=(14, 6))
@@ -596,13 +746,15 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if args.trends:
-        height_path, weight_path = create_t1_trend_charts(OUTPUT_DIR)
-        print(f"Done. Charts saved to:\n  {height_path}\n  {weight_path}")
-    elif args.t1:
-        output_path = OUTPUT_DIR / "t1_international_height_weight_animated.gif"
-        create_t1_animation(output_path, split_position=args.split_position)
-        print(f"Done. Animation saved to {output_path}")
+    if args.trends or args.t1:
+        # --trends and --t1 can be combined; they share one load of the monthly data
+        if args.trends:
+            height_path, weight_path = create_t1_trend_charts(OUTPUT_DIR)
+            print(f"Done. Charts saved to:\n  {height_path}\n  {weight_path}")
+        if args.t1:
+            output_path = OUTPUT_DIR / "t1_international_height_weight_animated.gif"
+            create_t1_animation(output_path, split_position=args.split_position)
+            print(f"Done. Animation saved to {output_path}")
     elif args.animate:
         output_path = OUTPUT_DIR / "six_nations_height_weight_animated.gif"
         create_animation(output_path, split_position=args.split_position)
@@ -0,0 +1,44 @@
+import unittest
+
+import pandas as pd
+
+from src.visualization.heatmap import merge_players
+
+
+class MergePlayersTest(unittest.TestCase):
+    def setUp(self):
+        self.bio_df = pd.DataFrame({
+            "name": ["Tom Curry", "Tom Curry", "Jamie Ritchie", "No Stats"],
+            "nationality": ["Australia", "England", "Scotland", "Fiji"],
+            "height_cm": [180.0, 185.0, 191.0, None],
+            "weight_kg": [100.0, 110.0, 112.0, None],
+        })
+
+    def test_categorical_team(self):
+        # Appearances are read with team as a categorical, including
+        # teams that have no entry in TEAM_NATIONALITY
+        players = pd.DataFrame({
+            "player_name": ["Tom Curry", "Jamie Ritchie", "No Stats", "Unknown"],
+            "team": pd.Categorical(["England", "Scotland", "Fiji", "Barbarians"]),
+        })
+        merged = merge_players(players, self.bio_df)
+
+        self.assertEqual(list(merged["player_name"]), ["Jamie Ritchie", "Tom Curry"])
+        tom = merged.set_index("player_name").loc["Tom Curry"]
+        self.assertEqual(tom["height_cm"], 185.0)
+        self.assertEqual(tom["weight_kg"], 110.0)
+
+    def test_keeps_position_group(self):
+        players = pd.DataFrame({
+            "player_name": ["Jamie Ritchie"],
+            "team": pd.Categorical(["Scotland"]),
+            "position_group": ["Forward"],
+        })
+        merged = merge_players(players, self.bio_df)
+
+        self.assertEqual(list(merged.columns),
+                         ["player_name", "team", "height_cm", "weight_kg", "position_group"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+from src.scraping.player_scraper import Player, parse_player_details
+
+
+class ParsePlayerDetailsTest(unittest.TestCase):
+    def test_empty_page(self):
+        player = Player(name="Tom Curry", slug="tom-curry")
+        self.assertIs(parse_player_details("", player), player)
+        self.assertIsNone(player.height)
+
+    def test_xml_declaration_only_page(self):
+        player = Player(name="Tom Curry", slug="tom-curry")
+        html = '<?xml version="1.0" encoding="utf-8"?>'
+        self.assertIs(parse_player_details(html, player), player)
+        self.assertIsNone(player.height)
+
+
+if __name__ == "__main__":
+    unittest.main()